@@ -1,7 +1,7 @@
 import sqlite3
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
 import pandas as pd
 import numpy as np
 
@@ -13,12 +13,47 @@ from backend.weather import get_track_weather as fetch_weather
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Shared SQL text for the home page query: identical strings hit sqlite3's statement cache
+SEASON_EVENTS_SQL = """
+    SELECT id, round_number, country, event_name, event_date,
+           date(event_date, '+3 days') AS end_date
+    FROM events
+    WHERE year = ?
+    ORDER BY round_number
+"""
+
+# event_date is stored as an ISO string, so 'now' is compared in the same format;
+# the (year, event_date) index serves both the filter and the ORDER BY ... LIMIT
+UPCOMING_EVENTS_SQL = """
+    SELECT id, round_number, country, event_name, event_date
+    FROM events
+    WHERE year = ? AND event_date > strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')
+    ORDER BY event_date
+    LIMIT ?
+"""
+
+
+class EventInfo(NamedTuple):
+    """Lightweight, immutable event record for callers that only read a single event."""
+    id: int
+    year: int
+    round_number: int
+    country: Optional[str]
+    location: Optional[str]
+    official_event_name: Optional[str]
+    event_name: Optional[str]
+    event_date: Optional[str]
+    event_format: Optional[str]
+    f1_api_support: Optional[int]
+
 
 class F1DataService:
     """Abstraction layer for F1 data access."""
 
     def __init__(self, sqlite_path: str = SQLITE_DB_PATH):
         self.sqlite_path = sqlite_path
+        # Whether the database has the season_standings aggregate; looked up on first use
+        self._has_season_standings = None
 
     @staticmethod
     def _convert_id(value):
@@ -32,8 +67,8 @@ class F1DataService:
         """Fetches distinct years from the events table."""
         query = "SELECT DISTINCT year FROM events ORDER BY year DESC"
         try:
-            with DatabaseConnectionHandler() as db:
-                return [row["year"] for row in db.execute_query(query)]
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                return [row["year"] for row in db.fetch_rows(query)]
         except DatabaseError as e:
             logger.error(f"Error retrieving available years: {e}")
             raise
@@ -49,23 +84,47 @@ class F1DataService:
             ORDER BY round_number
         """
         try:
-            with DatabaseConnectionHandler() as db:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
                 return db.execute_query(query, (year,))
         except DatabaseError as e:
             logger.error(f"Error retrieving events for year {year}: {e}")
             raise
 
+    def get_season_overview(self, year: int) -> pd.DataFrame:
+        """Fetches a season's events with their end dates.
+
+        Only the columns the home page shows are selected; the next event comes
+        from get_upcoming_events instead of this schedule.
+        """
+        year = self._convert_id(year)
+        try:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                return db.execute_query(SEASON_EVENTS_SQL, (year,))
+        except DatabaseError as e:
+            logger.error(f"Error retrieving season overview for year {year}: {e}")
+            raise
+
+    def get_upcoming_events(self, year: int, limit: int = 1) -> pd.DataFrame:
+        """Fetches the next events of a season, filtered and ordered in SQL."""
+        year = self._convert_id(year)
+        try:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                return db.execute_query(UPCOMING_EVENTS_SQL, (year, int(limit)))
+        except DatabaseError as e:
+            logger.error(f"Error retrieving upcoming events for year {year}: {e}")
+            raise
+
     def get_event(self, year: int, round_number: int) -> Dict[str, Any]:
         """Fetches a specific event."""
         year = self._convert_id(year)
         round_number = self._convert_id(round_number)
         query = "SELECT * FROM events WHERE year = ? AND round_number = ?"
         try:
-            with DatabaseConnectionHandler() as db:
-                result = db.execute_query(query, (year, round_number))
-            if not result:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                rows = db.fetch_rows(query, (year, round_number))
+            if not rows:
                 raise ResourceNotFoundError("Event", f"year={year}, round={round_number}")
-            return result[0]
+            return dict(rows[0])
         except DatabaseError as e:
             logger.error(f"Error retrieving event {round_number} for year {year}: {e}")
             raise
@@ -80,7 +139,7 @@ class F1DataService:
             ORDER BY date ASC
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 return db.execute_query(query, (event_id,))
         except DatabaseError as e:
             logger.error(f"Error retrieving sessions for event {event_id}: {e}")
@@ -96,7 +155,7 @@ class F1DataService:
             ORDER BY name
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 return db.execute_query(query, (year,))
         except DatabaseError as e:
             logger.error(f"Error retrieving teams for year {year}: {e}")
@@ -119,15 +178,25 @@ class F1DataService:
 
         query += " ORDER BY team_id, driver_number"
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 return db.execute_query(query, tuple(params))
         except DatabaseError as e:
             logger.error(f"Error retrieving drivers for year {year}, team {team_id}: {e}")
             raise
 
     def get_driver_standings(self, year: int) -> List[Dict[str, Any]]:
-        """Fetches driver standings for a given year based on race results."""
+        """Fetches driver standings for a given year based on race results.
+
+        Reads the season_standings aggregate written by the migration and only
+        falls back to summing results when that table has no rows for the year.
+        """
         year = self._convert_id(year)
+        standings_query = """
+            SELECT driver_id, full_name, abbreviation, team_name, team_color, total_points
+            FROM season_standings
+            WHERE year = ?
+            ORDER BY total_points DESC
+        """
         query = """
             SELECT d.id AS driver_id, d.full_name, d.abbreviation, 
                    t.name AS team_name, t.team_color, SUM(r.points) AS total_points
@@ -141,7 +210,17 @@ class F1DataService:
             ORDER BY total_points DESC
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                # The schema check runs once per service; the join is always a correct fallback,
+                # so a table created after this lookup only costs speed until the next restart
+                if self._has_season_standings is None:
+                    self._has_season_standings = bool(db.fetch_rows(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'season_standings'"
+                    ))
+                if self._has_season_standings:
+                    standings = db.execute_query(standings_query, (year,))
+                    if not standings.empty:
+                        return standings
                 return db.execute_query(query, (year,))
         except DatabaseError as e:
             logger.error(f"Error retrieving driver standings for year {year}: {e}")
@@ -163,7 +242,7 @@ class F1DataService:
             ORDER BY total_points DESC
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 return db.execute_query(query, (year,))
         except DatabaseError as e:
             logger.error(f"Error retrieving constructor standings for year {year}: {e}")
@@ -183,7 +262,7 @@ class F1DataService:
             ORDER BY r.position
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 return db.execute_query(query, (session_id,))
         except DatabaseError as e:
             logger.error(f"Error retrieving race results for session {session_id}: {e}")
@@ -212,6 +291,53 @@ class F1DataService:
             logger.error(f"Database error during lap time retrieval: {e}")
             raise DatabaseError("Error retrieving lap times")
 
+    def get_session_laps(self, session_id: int) -> pd.DataFrame:
+        """
+        Fetches the non-deleted laps of a session with only the columns the lap times page uses,
+        with driver and team labels joined in. Team colours are returned with a leading '#'
+        so they can be handed to Plotly directly.
+        """
+        session_id = self._convert_id(session_id)
+        query = """
+            SELECT d.full_name AS driver_name, t.name AS team_name,
+                   CASE WHEN t.team_color IS NULL OR t.team_color = '' THEN NULL
+                        WHEN t.team_color LIKE '#%' OR t.team_color LIKE 'rgb%' THEN t.team_color
+                        ELSE '#' || t.team_color END AS team_color,
+                   l.lap_number, l.lap_time, l.sector1_time, l.sector2_time, l.sector3_time,
+                   l.compound, l.tyre_life, l.stint
+            FROM laps l
+            JOIN drivers d ON l.driver_id = d.id
+            LEFT JOIN teams t ON d.team_id = t.id
+            WHERE l.session_id = ? AND l.deleted IS NOT 1
+            ORDER BY l.driver_id, l.lap_number
+        """
+        try:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                return db.execute_query(query, (session_id,))
+        except DatabaseError as e:
+            logger.error(f"Error retrieving laps for session {session_id}: {e}")
+            raise
+
+    def get_fuel_load_laps(self, session_id: int) -> pd.DataFrame:
+        """
+        Fetches the laps of a session for the fuel load page: driver names joined in
+        (keeping laps whose driver row is missing) and rows ordered per driver by lap.
+        """
+        session_id = self._convert_id(session_id)
+        query = """
+            SELECT d.full_name AS driver_name, l.lap_number, l.lap_time, l.tyre_life
+            FROM laps l
+            LEFT JOIN drivers d ON l.driver_id = d.id
+            WHERE l.session_id = ?
+            ORDER BY l.driver_id, l.lap_number
+        """
+        try:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                return db.execute_query(query, (session_id,))
+        except DatabaseError as e:
+            logger.error(f"Error retrieving fuel load laps for session {session_id}: {e}")
+            raise
+
     def get_telemetry(self, session_id: int, driver_id: int, lap_number: int) -> pd.DataFrame:
         session_id = self._convert_id(session_id)
         driver_id = self._convert_id(driver_id)
@@ -244,7 +370,7 @@ class F1DataService:
             ORDER BY time ASC
         """
         try:
-            with DatabaseConnectionHandler() as db: 
+            with DatabaseConnectionHandler(self.sqlite_path) as db: 
                 result = db.execute_query(query, (session_id,))
             if not result:
                 return {"error": "No weather data available"}
@@ -279,7 +405,7 @@ class F1DataService:
             ORDER BY date
         """
         try:
-            with DatabaseConnectionHandler() as db:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
                 return db.execute_query(query, (event_id,))
         except DatabaseError as e:
             logger.error(f"Error retrieving race sessions for event {event_id}: {e}")
@@ -303,7 +429,7 @@ class F1DataService:
             WHERE id = ?
         """
         try:
-            with DatabaseConnectionHandler() as db:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
                 results = db.execute_query(query, (event_id,))
             if results:
                 return results[0]
@@ -312,6 +438,39 @@ class F1DataService:
             logger.error(f"Error retrieving event {event_id}: {e}")
             return None
 
+    def get_event_schedule(self, event_id):
+        """
+        Fetches an event together with its sessions over a single connection.
+        
+        Parameters:
+        - event_id: The ID of the event
+        
+        Returns:
+        - Tuple of (EventInfo or None, DataFrame of sessions ordered by date)
+        """
+        event_id = self._convert_id(event_id)
+        event_query = """
+            SELECT id, year, round_number, country, location, official_event_name,
+                event_name, event_date, event_format, f1_api_support
+            FROM events
+            WHERE id = ?
+        """
+        sessions_query = """
+            SELECT id, name, date, session_type, total_laps, session_start_time, t0_date
+            FROM sessions
+            WHERE event_id = ?
+            ORDER BY date IS NULL, date ASC
+        """
+        try:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
+                event_df = db.execute_query(event_query, (event_id,))
+                sessions_df = db.execute_query(sessions_query, (event_id,))
+            event = EventInfo(*next(event_df.itertuples(index=False))) if not event_df.empty else None
+            return event, sessions_df
+        except DatabaseError as e:
+            logger.error(f"Error retrieving schedule for event {event_id}: {e}")
+            raise
+
     def get_track_performance(self, event_id):
         """
         Fetches track-specific performance data.
@@ -488,7 +647,7 @@ class F1DataService:
         """
         
         try:
-            with DatabaseConnectionHandler() as db:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
                 return db.execute_query(query, (session_id,))
         except DatabaseError as e:
             logger.error(f"Error retrieving drivers for session {session_id}: {e}")
@@ -594,7 +753,7 @@ class F1DataService:
         """
 
         try:
-            with DatabaseConnectionHandler() as db:
+            with DatabaseConnectionHandler(self.sqlite_path) as db:
                 df = pd.read_sql_query(query, db.conn, params=(session_id,))
                 
                 if df.empty:
@@ -2,6 +2,7 @@ import sqlite3
 import logging
 from typing import Optional
 import os
+import threading
 from contextlib import contextmanager
 
 from backend.error_handling import DatabaseError
@@ -13,34 +14,101 @@ logger.setLevel(logging.INFO)
 # Database file path
 DB_PATH = os.getenv("SQLITE_DB_PATH", "f1_data_full_2025.db")
 
-# Connection pooling (singleton instance)
+# Pragmas applied once per pooled connection; these only affect the connection itself
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+)
+
+# WAL keeps reads cheap for the read-mostly dashboard, but it is stored in the database file and needs
+# writable -wal/-shm files next to it. Set SQLITE_WAL=False when only the .db file is persisted (e.g. a
+# single-file bind mount), since the sidecar files would then be lost with the container.
+SQLITE_WAL = os.getenv("SQLITE_WAL", "True") == "True"
+
+# sqlite3 keeps compiled statements per connection keyed by SQL text; the pooled
+# connection lives for the whole process, so give it room for every query we issue
+STATEMENT_CACHE_SIZE = 256
+
+def _enable_wal(conn: sqlite3.Connection, db_path: str):
+    """Switches a writable on-disk database to WAL once; read-only or refused databases keep their journal."""
+    if not SQLITE_WAL or db_path == ":memory:":
+        return
+
+    db_dir = os.path.dirname(os.path.abspath(db_path))
+    if not (os.access(db_path, os.W_OK) and os.access(db_dir, os.W_OK)):
+        logger.info(f"Database {db_path} is not writable; keeping its current journal mode")
+        return
+
+    try:
+        # journal_mode persists in the file, so only issue the switch when it is not already WAL
+        if conn.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            logger.info(f"Journal mode for {db_path}: {mode}")
+    except sqlite3.Error as e:
+        logger.warning(f"Could not enable WAL for {db_path}: {e}")
+
+# season_standings is a per-year copy of the points totals; every script that rewrites
+# results rebuilds it through rebuild_season_standings so the SQL lives in one place
+SEASON_STANDINGS_INSERT_SQL = """
+    INSERT INTO season_standings (
+        year, driver_id, full_name, abbreviation, team_name, team_color, total_points
+    )
+    SELECT e.year, d.id, d.full_name, d.abbreviation,
+           t.name, t.team_color, SUM(r.points)
+    FROM drivers d
+    JOIN teams t ON d.team_id = t.id
+    JOIN results r ON d.id = r.driver_id
+    JOIN sessions s ON r.session_id = s.id
+    JOIN events e ON s.event_id = e.id
+    WHERE e.year = ?
+    GROUP BY d.id
+"""
+
+def rebuild_season_standings(conn: sqlite3.Connection, year: int):
+    """Replaces a year's season_standings rows with fresh totals from results and commits."""
+    conn.execute("DELETE FROM season_standings WHERE year = ?", (year,))
+    conn.execute(SEASON_STANDINGS_INSERT_SQL, (year,))
+    conn.commit()
+
+# Connection pooling (one singleton instance per database path, one connection per thread)
 class SQLiteConnectionPool:
     """Singleton connection pool to reuse database connections."""
-    _instance = None
+    _instances = {}
+    _lock = threading.Lock()
 
     def __new__(cls, db_path=DB_PATH):
-        if cls._instance is None:
-            cls._instance = super(SQLiteConnectionPool, cls).__new__(cls)
-            cls._instance.db_path = db_path
-            cls._instance._connection = None
-        return cls._instance
+        with cls._lock:
+            if db_path not in cls._instances:
+                instance = super(SQLiteConnectionPool, cls).__new__(cls)
+                instance.db_path = db_path
+                # sqlite3 connections are not safe to share between threads, so each
+                # Streamlit script thread / worker thread keeps its own
+                instance._local = threading.local()
+                cls._instances[db_path] = instance
+            return cls._instances[db_path]
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with proper error handling."""
-        if self._connection is None:
+        """Get this thread's database connection with proper error handling."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
             try:
-                self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
-                self._connection.row_factory = sqlite3.Row
+                conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+                conn.row_factory = sqlite3.Row
+                for pragma in CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+                _enable_wal(conn, self.db_path)
                 logger.info(f"Connected to SQLite database: {self.db_path}")
             except sqlite3.Error as e:
                 raise DatabaseError(f"Database connection error: {str(e)}")
-        return self._connection
+            self._local.connection = conn
+        return conn
 
     def close_connection(self):
-        """Closes the database connection if it exists."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Closes this thread's database connection if it exists."""
+        conn = getattr(self._local, "connection", None)
+        if conn:
+            conn.close()
+            self._local.connection = None
             logger.info("Database connection closed.")
 
 # Context manager for managing connections
@@ -53,6 +121,4 @@ def get_db_connection():
         yield conn
     except sqlite3.Error as e:
         logger.error(f"Database error: {e}")
-        raise DatabaseError(f"Unexpected database error: {str(e)}")
-    finally:
-        pool.close_connection()
\ No newline at end of file
+        raise DatabaseError(f"Unexpected database error: {str(e)}")
\ No newline at end of file
@@ -5,7 +5,7 @@ import os
 from typing import Dict, Any, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
-from backend.database import get_db_connection
+from backend.database import SQLiteConnectionPool
 from backend.error_handling import DatabaseError, ResourceNotFoundError, ValidationError, handle_exception
 
 # Configure logging
@@ -27,8 +27,8 @@ class DatabaseConnectionHandler:
                 logger.error(f"Database file not found: {self.db_path}")
                 raise DatabaseError(f"Database file not found: {self.db_path}")
 
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
+            # Reuse the pooled connection instead of reconnecting (and replaying pragmas) per query
+            self.conn = SQLiteConnectionPool(self.db_path).get_connection()
 
             logger.debug(f"Successfully connected to database: {self.db_path}")
             return self
@@ -37,10 +37,16 @@ class DatabaseConnectionHandler:
             raise DatabaseError(f"Error connecting to database: {e}")
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # The pooled connection stays open for the next handler, so undo any work left
+        # half-done by a failed block before dropping our reference
         if self.conn:
-            self.conn.close()
+            if exc_type is not None:
+                try:
+                    self.conn.rollback()
+                except sqlite3.Error as e:
+                    logger.warning(f"Rollback failed: {e}")
             self.conn = None
-            logger.debug("Database connection closed")
+            logger.debug("Released pooled database connection")
     
     def execute_query(self, query: str, params: Tuple = ()) -> pd.DataFrame:
         logger.debug(f"Executing SQL Query: {query} with params {params}")
@@ -58,6 +64,15 @@ class DatabaseConnectionHandler:
             logger.exception(f"Database query execution error: {e}")
             raise DatabaseError(f"Database query execution error: {e}")
     
+    def fetch_rows(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """Runs a query and returns raw rows, skipping DataFrame construction for tiny results."""
+        logger.debug(f"Fetching rows for SQL Query: {query} with params {params}")
+        try:
+            return self.conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.exception(f"Database query execution error: {e}")
+            raise DatabaseError(f"Database query execution error: {e}")
+
     def get_event(self, event_id: Union[int, str]) -> Dict[str, Any]:
         try:
             event_id_int = int(event_id)
@@ -11,6 +11,11 @@ import pandas as pd
 import fastf1
 from tqdm import tqdm
 
+# Ensure Python recognizes backend directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.database import rebuild_season_standings
+
 ###########################
 #       Script usage
 # python updated-sprint-fixer.py --list                      # List all sessions in the database
@@ -124,6 +129,19 @@ def delete_session_data(db_path: str, session_id: int) -> None:
     conn.close()
     logger.info(f"Deleted existing data for session ID {session_id}")
 
+def refresh_season_standings(db_path: str, year: int) -> None:
+    """Rebuild the season_standings rows for a year so they match the rewritten results."""
+    conn = sqlite3.connect(db_path)
+    
+    try:
+        rebuild_season_standings(conn, year)
+        logger.info(f"Refreshed season standings for {year}")
+    except sqlite3.OperationalError:
+        # Older databases have no season_standings table; standings are then read from results directly
+        logger.warning("Table 'season_standings' doesn't exist, skipping")
+    finally:
+        conn.close()
+
 def get_driver_ids(conn: sqlite3.Connection, year: int) -> Dict[str, int]:
     """Get mapping of driver abbreviations to database IDs."""
     cursor = conn.cursor()
@@ -559,6 +577,10 @@ def fix_session(session_id: int, db_path: str = DB_PATH, force_reload: bool = Fa
         logger.error(f"Error loading session from FastF1: {e}")
         import traceback
         logger.error(traceback.format_exc())
+        
+    finally:
+        # Results may have been deleted or rewritten above, even if the reload then failed
+        refresh_season_standings(db_path, session_info['year'])
 
 def fix_all_sprints(year: int, db_path: str = DB_PATH, force_reload: bool = False,
                     verbose: bool = False) -> None:
@@ -13,6 +13,11 @@ from tqdm import tqdm
 import fastf1
 from fastf1.core import Session
 
+# Ensure Python recognizes backend directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.database import rebuild_season_standings
+
 # Handle dotenv conditionally
 try:
     from dotenv import load_dotenv
@@ -124,6 +129,9 @@ class SQLiteF1Client:
                     UNIQUE(year, round_number)
                 )
             ''')
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_events_year_date ON events(year, event_date)"
+            )
 
             # Sessions table
             self.cursor.execute('''
@@ -309,6 +317,24 @@ class SQLiteF1Client:
                 )
             ''')
             
+            # Per-season driver standings, refreshed after each ingest
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS season_standings (
+                    year INTEGER,
+                    driver_id INTEGER,
+                    full_name TEXT,
+                    abbreviation TEXT,
+                    team_name TEXT,
+                    team_color TEXT,
+                    total_points REAL,
+                    PRIMARY KEY(year, driver_id),
+                    FOREIGN KEY(driver_id) REFERENCES drivers(id)
+                )
+            ''')
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_season_standings_points ON season_standings(year, total_points DESC)"
+            )
+
             self.commit()
             migration_logger.info("Created/verified all tables successfully.")
             return True
@@ -1280,6 +1306,15 @@ def list_sessions_by_event(db: SQLiteF1Client, year: int, event_name: str):
         migration_logger.error(traceback.format_exc())
         print(f"Error: {e}")
 
+def refresh_season_standings(db: SQLiteF1Client, year: int):
+    """Rebuild the season_standings rows for a year from the results table."""
+    try:
+        rebuild_season_standings(db.conn, year)
+        migration_logger.info(f"Refreshed season standings for {year}")
+    except Exception as e:
+        migration_logger.error(f"Error refreshing season standings for {year}: {e}")
+        migration_logger.error(traceback.format_exc())
+
 def migrate_single_event(db: SQLiteF1Client, year: int, event_name: str, force_reload: bool = False):
     """Migrate data for a specific event only."""
     try:
@@ -1472,6 +1507,9 @@ def main():
             else:
                 print(f"\nFixing all sprint sessions for year: {args.year}")
                 fix_sprint_sessions(db, args.year, args.force_reload)
+
+            # Sprint fixes rewrite results, so the standings aggregate must follow
+            refresh_season_standings(db, args.year)
                 
         else:
             # Regular migration
@@ -1492,7 +1530,8 @@ def main():
                 
                 # Step 3: Migrate session details
                 migrate_session_details(db, schedule, args.year, args.force_reload)
-            
+
+            refresh_season_standings(db, args.year)
             print(f"\nMigration completed")
             
         # Show final status
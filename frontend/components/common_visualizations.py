@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import numpy as np
+import pandas as pd
 
 def create_line_chart(df, x_col, y_col, title, x_label, y_label, driver_color="red", compare_df=None, compare_color="blue"):
     """
@@ -58,4 +59,115 @@ def create_pie_chart(df, values_col, names_col, title):
         font=dict(color='white')
     )
 
-    return fig
\ No newline at end of file
+    return fig
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the positional indices of the points to keep, preserving the visual shape of the series.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries for everything between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Triangle area between the previously selected point, each candidate and the next bucket's average
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def m4_indices(x, y, n_out):
+    """
+    M4 (min/max) downsampling: splits x into n_out // 4 equal-width buckets and keeps the rows holding
+    each bucket's first/last x and lowest/highest y. Returns sorted positional indices.
+    Rows with a missing x or y cannot be placed in a bucket and are left out of the result.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(x)
+    n_buckets = n_out // 4
+
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+
+    positions = np.flatnonzero(~np.isnan(x) & ~np.isnan(y))
+    if len(positions) <= n_out:
+        return positions
+    x, y = x[positions], y[positions]
+
+    edges = np.linspace(x.min(), x.max(), n_buckets + 1)
+    buckets = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, n_buckets - 1)
+    # Indexed by original position, so idxmin/idxmax return positions into the caller's arrays
+    grouped = pd.DataFrame({"bucket": buckets, "x": x, "y": y}, index=positions).groupby("bucket", sort=False)
+
+    keep = [grouped[col].idxmin().to_numpy() for col in ("x", "y")]
+    keep += [grouped[col].idxmax().to_numpy() for col in ("x", "y")]
+    return np.unique(np.concatenate(keep))
+
+
+def downsample_by_group(df, group_col, x_col, y_col, n_out=2000, method="lttb"):
+    """
+    Downsamples per group (e.g. per driver) so each trace sends at most n_out points to the browser.
+    method is "lttb" (shape-preserving) or "m4" (keeps per-bucket extremes).
+    Groups of at most n_out rows are returned unchanged. In larger groups only the rows with a y value
+    are downsampled; rows with a missing y are kept in place so the plotted line still breaks there.
+    """
+    if df is None or df.empty or len(df) <= n_out:
+        return df
+
+    pick_indices = m4_indices if method == "m4" else lttb_indices
+
+    parts = []
+    # dropna=False keeps rows whose group key is missing (e.g. a lap without a stint number)
+    for _, group in df.groupby(group_col, sort=False, observed=True, dropna=False):
+        if len(group) <= n_out:
+            parts.append(group)
+            continue
+
+        has_y = group[y_col].notna().to_numpy()
+        valid_positions = np.flatnonzero(has_y)
+        keep = ~has_y
+        if len(valid_positions) > n_out:
+            picked = pick_indices(
+                group[x_col].to_numpy()[valid_positions], group[y_col].to_numpy()[valid_positions], n_out
+            )
+            keep[valid_positions[picked]] = True
+        else:
+            keep[valid_positions] = True
+        parts.append(group[keep])
+
+    return pd.concat(parts) if parts else df
+
+
+def show_dataframe_preview(df, file_name, max_rows=500, column_config=None):
+    """
+    Displays at most max_rows of a DataFrame and offers the full data as a CSV download,
+    so long tables don't ship every row to the browser.
+    """
+    st.dataframe(df.head(max_rows), use_container_width=True, hide_index=True, column_config=column_config)
+
+    if len(df) > max_rows:
+        st.caption(f"Showing the first {max_rows} of {len(df)} rows.")
+
+    st.download_button("Download full data", df.to_csv(index=False), file_name, mime="text/csv")
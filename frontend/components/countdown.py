@@ -10,7 +10,8 @@ def get_next_event(events_df):
     if events_df is None or len(events_df) == 0:
         return None
 
-    events_df['event_date_dt'] = pd.to_datetime(events_df['event_date'], errors='coerce')
+    if 'event_date_dt' not in events_df.columns:
+        events_df['event_date_dt'] = pd.to_datetime(events_df['event_date'], errors='coerce')
     now = pd.Timestamp(datetime.now())
 
     future_events = events_df[events_df['event_date_dt'] > now].sort_values(by='event_date_dt')
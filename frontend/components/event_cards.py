@@ -2,20 +2,61 @@ import streamlit as st
 from datetime import datetime
 import pandas as pd
 
+# Flag CDN country codes (already lower-case)
+_COUNTRY_CODES = {
+    "Australia": "au",
+    "Austria": "at",
+    "Azerbaijan": "az",
+    "Bahrain": "bh",
+    "Belgium": "be",
+    "Brazil": "br",
+    "Canada": "ca",
+    "China": "cn",
+    "France": "fr",
+    "Germany": "de",
+    "Hungary": "hu",
+    "Italy": "it",
+    "Japan": "jp",
+    "Mexico": "mx",
+    "Monaco": "mc",
+    "Netherlands": "nl",
+    "Portugal": "pt",
+    "Qatar": "qa",
+    "Saudi Arabia": "sa",
+    "Singapore": "sg",
+    "Spain": "es",
+    "United Arab Emirates": "ae",
+    "United Kingdom": "gb",
+    "United States": "us",
+    "Miami": "us",
+    "Las Vegas": "us",
+    "Abu Dhabi": "ae",
+    "Emilia Romagna": "it"
+}
+
+
+def _navigate(event_id, year, page):
+    """Button callback: state is updated before Streamlit's own rerun, so no extra st.rerun is needed."""
+    st.session_state.update(selected_event=event_id, selected_year=year, page=page)
+
+
 def event_card(event_data, is_past=False):
     """
     Creates an event card that navigates to the appropriate page when clicked.
+    Returns True on the rerun triggered by its button.
     """
     event_id = event_data.get('id', 'unknown')
 
     page_destination = "Analytics" if is_past else "Event Schedule"
 
-    event_date = event_data.get("event_date", "TBA")
-    try:
-        date_obj = pd.to_datetime(event_date)
-        formatted_date = date_obj.strftime("%d %b %Y") if pd.notna(date_obj) else "TBA"
-    except Exception:
-        formatted_date = "TBA"
+    formatted_date = event_data.get("formatted_date")
+    if formatted_date is None:
+        event_date = event_data.get("event_date", "TBA")
+        try:
+            date_obj = pd.to_datetime(event_date)
+            formatted_date = date_obj.strftime("%d %b %Y") if pd.notna(date_obj) else "TBA"
+        except Exception:
+            formatted_date = "TBA"
 
     country_code = get_country_code(event_data.get('country', ''))
     flag_url = f"https://flagcdn.com/w40/{country_code}.png"
@@ -31,10 +72,12 @@ def event_card(event_data, is_past=False):
 
     st.image(flag_url, width=40)
 
-    if st.button(f"View {event_data.get('event_name')}", key=f"btn_{event_id}"):
-        st.session_state["selected_event"] = event_id
-        st.session_state["page"] = page_destination
-        st.rerun()
+    return st.button(
+        f"View {event_data.get('event_name')}",
+        key=f"btn_{event_id}",
+        on_click=_navigate,
+        args=(event_id, event_data.get("year", datetime.now().year), page_destination),
+    )
 
 
 def event_cards_grid(events_df, key_prefix=""):
@@ -49,10 +92,11 @@ def event_cards_grid(events_df, key_prefix=""):
 
     if isinstance(events_df, pd.DataFrame) and 'event_date' in events_df.columns:
         events_df['event_date_dt'] = pd.to_datetime(events_df['event_date'], errors='coerce')
+        events_df['formatted_date'] = events_df['event_date_dt'].dt.strftime("%d %b %Y").fillna("TBA")
 
-    for idx, event in events_df.iterrows():
-        event_dict = event.to_dict() if isinstance(event, pd.Series) else event
+    records = events_df.to_dict("records") if isinstance(events_df, pd.DataFrame) else events_df
 
+    for idx, event_dict in enumerate(records):
         event_date = event_dict.get('event_date_dt')
         if pd.isna(event_date):
             is_past = False
@@ -60,45 +104,11 @@ def event_cards_grid(events_df, key_prefix=""):
             is_past = event_date.date() < current_date.date()
 
         with cols[idx % 3]:
-            card_clicked = event_card(event_dict, is_past)
-            if card_clicked:
+            if event_card(event_dict, is_past):
                 selected_event = event_dict.get("id")
-                st.session_state['selected_event'] = selected_event
-                st.session_state['selected_year'] = event_dict.get("year", datetime.now().year)
 
     return selected_event
 
 
 def get_country_code(country_name):
-    country_map = {
-        "Australia": "au",
-        "Austria": "at",
-        "Azerbaijan": "az",
-        "Bahrain": "bh",
-        "Belgium": "be",
-        "Brazil": "br",
-        "Canada": "ca",
-        "China": "cn",
-        "France": "fr",
-        "Germany": "de",
-        "Hungary": "hu",
-        "Italy": "it",
-        "Japan": "jp",
-        "Mexico": "mx",
-        "Monaco": "mc",
-        "Netherlands": "nl",
-        "Portugal": "pt",
-        "Qatar": "qa",
-        "Saudi Arabia": "sa",
-        "Singapore": "sg",
-        "Spain": "es",
-        "United Arab Emirates": "ae",
-        "United Kingdom": "gb",
-        "United States": "us",
-        "Miami": "us",
-        "Las Vegas": "us",
-        "Abu Dhabi": "ae",
-        "Emilia Romagna": "it"
-    }
-
-    return country_map.get(country_name, "xx").lower()
\ No newline at end of file
+    return _COUNTRY_CODES.get(country_name, "xx")
@@ -0,0 +1,9 @@
+import streamlit as st
+
+from backend.data_service import F1DataService
+
+
+@st.cache_resource
+def get_data_service():
+    """Returns one F1DataService shared by every page and rerun instead of building one per page import."""
+    return F1DataService()
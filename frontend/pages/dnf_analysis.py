@@ -4,11 +4,12 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
+from frontend.components.common_visualizations import show_dataframe_preview
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     if isinstance(data, pd.DataFrame):
@@ -35,11 +36,11 @@ def dnf_analysis():
 
         # Fetch events
         events = data_service.get_events(selected_year)
-        if not events:
+        if is_data_empty(events):
             st.warning("No events available.")
             return
 
-        event_options = {event["event_name"]: event["id"] for event in events}
+        event_options = {event["event_name"]: int(event["id"]) for event in pd.DataFrame(events).to_dict("records")}
         event_names = list(event_options.keys())
         event_ids = list(event_options.values())
 
@@ -54,11 +55,11 @@ def dnf_analysis():
 
         # Fetch race sessions
         sessions = data_service.get_race_sessions(event_id)
-        if not sessions:
+        if is_data_empty(sessions):
             st.warning("No race sessions available.")
             return
 
-        session_options = {session["name"]: session["id"] for session in sessions}
+        session_options = {session["name"]: int(session["id"]) for session in pd.DataFrame(sessions).to_dict("records")}
         session_names = list(session_options.keys())
         session_ids = list(session_options.values())
 
@@ -91,7 +92,7 @@ def dnf_analysis():
 
         # Display DNF dataset
         st.subheader("📋 DNF Data")
-        st.dataframe(dnf_df, use_container_width=True)
+        show_dataframe_preview(dnf_df, "dnf_data.csv")
 
     except DatabaseError as e:
         st.error(f"⚠️ Database error: {e}")
@@ -151,4 +152,5 @@ def plot_team_dnf_analysis(df):
     st.plotly_chart(fig, use_container_width=True)
 
 
-dnf_analysis()
+if __name__ == "__main__":
+    dnf_analysis()
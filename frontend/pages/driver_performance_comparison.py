@@ -6,14 +6,16 @@ import seaborn as sns
 import plotly.express as px
 from collections import defaultdict
 from backend.db_connection import get_db_handler
+from frontend.components.common_visualizations import downsample_by_group, show_dataframe_preview
+
+# Upper bound on points sent to the browser per lap-time trace
+MAX_POINTS_PER_TRACE = 2000
 
 st.set_page_config(layout="wide")
 st.title("🏎️ Driver Performance Comparison")
 
-def get_driver_performance_data(session_id, driver_ids):
-    session_id = int(session_id)
-    driver_ids = tuple(map(int, driver_ids))
-
+def get_driver_performance_data(session_id: int, driver_ids: tuple) -> pd.DataFrame:
+    """Lap and sector times for the given drivers; ids are expected as plain ints from the selectboxes."""
     query = """
         SELECT laps.lap_number, drivers.full_name AS driver_name,
                laps.lap_time, laps.sector1_time, laps.sector2_time, laps.sector3_time
@@ -39,8 +41,10 @@ def plot_lap_time_comparison(df):
     """
     Creates a Plotly-based lap time comparison chart with dark theme.
     """
+    plot_df = downsample_by_group(df, "driver_name", "lap_number", "lap_time", MAX_POINTS_PER_TRACE)
+
     fig = px.line(
-        df,
+        plot_df,
         x="lap_number",
         y="lap_time",
         color="driver_name",
@@ -123,7 +127,7 @@ with get_db_handler() as db:
 
 # Group sessions by event
 event_sessions = defaultdict(list)
-for s in session_data:
+for s in session_data.to_dict("records"):
     event_sessions[s["event_name"]].append(s)
 
 # Select Event
@@ -133,27 +137,34 @@ selected_event = st.selectbox("Select Event", event_names)
 # Select Session
 sessions_for_event = event_sessions[selected_event]
 session_labels = [f'{s["session_name"]}' for s in sessions_for_event]
-session_ids = [s["session_id"] for s in sessions_for_event]
+session_ids = [int(s["session_id"]) for s in sessions_for_event]
 selected_session_idx = st.selectbox("Select Session", range(len(session_ids)), format_func=lambda i: session_labels[i])
 selected_session = session_ids[selected_session_idx]
 
 # Select Drivers
 driver_dict = {
     int(driver["driver_id"]): driver["full_name"]
-    for driver in drivers
+    for driver in drivers.to_dict("records")
     if driver.get("driver_id") and driver.get("full_name")
 }
 selected_drivers = st.multiselect("Select Drivers", driver_dict.keys(), format_func=lambda x: driver_dict[x])
 
 # Run visualizations
 if len(selected_drivers) >= 2:
-    df = get_driver_performance_data(selected_session, selected_drivers)
+    df = get_driver_performance_data(selected_session, tuple(selected_drivers))
     
     if isinstance(df, pd.DataFrame) and not df.empty:
         plot_lap_time_comparison(df)
         plot_sector_times(df)
         st.write("### Driver Performance Data")
-        st.dataframe(df)
+        show_dataframe_preview(
+            df,
+            "driver_performance_laps.csv",
+            column_config={
+                col: st.column_config.NumberColumn(format="%.3f")
+                for col in ["lap_time", "sector1_time", "sector2_time", "sector3_time"]
+            },
+        )
     else:
         st.warning("No lap time data available for this session.")
 else:
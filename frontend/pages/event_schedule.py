@@ -1,19 +1,121 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.weather import get_weather_for_location
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
+
+# Accent colour per session type (keys are lower-case)
+_SESSION_COLORS = {
+    "practice": "#1e90ff",
+    "qualifying": "#ff4500",
+    "race": "#228b22",
+    "sprint": "#8a2be2",
+    "sprint_qualifying": "#ff8c00",
+    "sprint_shootout": "#ff8c00",
+}
 
 def is_data_empty(data):
     if isinstance(data, pd.DataFrame):
         return data.empty
     return not bool(data)
 
+@st.cache_data(ttl=300)
+def _get_schedule_cached(event_id):
+    """
+    Event details plus its sessions (already date-ordered by the query) with dates parsed, formatted and colour-coded.
+    Both come from one connection and are cached so reruns skip the queries and the parsing.
+    """
+    event_info, sessions = data_service.get_event_schedule(event_id)
+    if is_data_empty(sessions):
+        return event_info, pd.DataFrame()
+
+    sessions_df = pd.DataFrame(sessions)
+    sessions_df["date"] = pd.to_datetime(sessions_df["date"], errors="coerce")
+    sessions_df["color"] = sessions_df["session_type"].str.lower().map(_SESSION_COLORS).fillna("#444")
+    sessions_df["formatted"] = sessions_df["date"].dt.strftime("%d %b %Y, %H:%M").fillna("TBA")
+    return event_info, sessions_df
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_weather(location, iso):
+    return get_weather_for_location(location, iso)
+
+def _weather_key(date):
+    """Hour-resolution ISO timestamp, so sessions in the same hour share a cached forecast."""
+    return date.replace(minute=0, second=0, microsecond=0).isoformat()
+
+def _fetch_session_weather(location, date):
+    if pd.isna(date):
+        return None
+    try:
+        return _cached_weather(location, _weather_key(date))
+    except Exception:
+        return None
+
+def _upcoming_cards_html(sessions, weathers=None):
+    """HTML for the upcoming session cards; weathers=None renders a loading placeholder in place of the forecast."""
+    html_parts = []
+    for i, session in enumerate(sessions):
+        formatted_time = session["formatted"]
+        session_color = session["color"]
+        session_weather = weathers[i] if weathers is not None else None
+
+        if weathers is None:
+            html_parts.append(f"""
+            <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
+                <h3>{session['name']}</h3>
+                <p>📅 {formatted_time}</p>
+                <p>⏳ Loading weather...</p>
+            </div>
+            """)
+        elif session_weather:
+            html_parts.append(f"""
+            <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
+                <h3>{session['name']}</h3>
+                <p>📅 {formatted_time}</p>
+                <div style="display: flex; gap: 20px; font-size: 16px;">
+                    <span>🌡️ <b>{session_weather.get('temperature', 'N/A')}°C</b></span>
+                    <span>🔥 <b>{session_weather.get('track_temperature', 'N/A')}°C</b></span>
+                    <span>💨 <b>{session_weather.get('wind_speed', 'N/A')} km/h</b></span>
+                    <span>☁️ <b>{session_weather.get('cloud_cover', 'N/A')}%</b></span>
+                    <span>🌧️ <b>{'Yes' if session_weather.get('rainfall', False) else 'No'}</b></span>
+                </div>
+            </div>
+            """)
+        else:
+            html_parts.append(f"""
+            <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
+                <h3>{session['name']}</h3>
+                <p>📅 {formatted_time}</p>
+                <p>⚠️ Weather data unavailable.</p>
+            </div>
+            """)
+
+    return "\n".join(html_parts)
+
+@st.fragment
+def _render_weather_cards(sessions, location):
+    """Renders upcoming session cards with their forecast; reruns on its own when the forecast is refreshed."""
+    if st.button("🔄 Refresh weather", key="refresh_session_weather"):
+        _cached_weather.clear()
+
+    # Paint the cards straight away and swap in the forecasts once they arrive.
+    # A single placeholder keeps this to one element rather than one per session.
+    cards_slot = st.empty()
+    cards_slot.markdown(_upcoming_cards_html(sessions), unsafe_allow_html=True)
+
+    # Fetch all forecasts concurrently; the requests are I/O bound so wall time is roughly one round trip
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        weathers = list(executor.map(lambda session: _fetch_session_weather(location, session["date"]), sessions))
+
+    cards_slot.markdown(_upcoming_cards_html(sessions, weathers), unsafe_allow_html=True)
+
 def event_schedule():
     st.title("📅 Event Schedule")
 
@@ -24,111 +126,47 @@ def event_schedule():
     event_id = st.session_state["selected_event"]
 
     try:
-        event_info = data_service.get_event_by_id(event_id)
+        event_info, sessions_df = _get_schedule_cached(event_id)
         if event_info is None:
             st.error("⚠️ Event not found.")
             return
 
-        if isinstance(event_info, pd.DataFrame):
-            event_info = event_info.iloc[0].to_dict()
-
-        event_name = event_info.get("event_name", "Unknown Event")
-        event_location = event_info.get("location", "Unknown Location")
+        event_name = event_info.event_name or "Unknown Event"
+        event_location = event_info.location or "Unknown Location"
 
         st.subheader(f"📅 Event Schedule - {event_name}")
 
-        sessions_df = data_service.get_sessions(event_id)
-
-        if is_data_empty(sessions_df):
+        if sessions_df.empty:
             st.warning("No sessions available for this event.")
             return
 
-        if not isinstance(sessions_df, pd.DataFrame):
-            sessions_df = pd.DataFrame(sessions_df)
-
-        sessions_df["date"] = pd.to_datetime(sessions_df["date"], errors="coerce")
-        sessions_df = sessions_df.sort_values(by="date")
-
-        def format_datetime(date):
-            if pd.isna(date):
-                return "TBA"
-            return date.strftime("%d %b %Y, %H:%M")
-
-        def get_session_color(session_type):
-            colors = {
-                "practice": "#1e90ff",
-                "qualifying": "#ff4500",
-                "race": "#228b22",
-                "sprint": "#8a2be2",
-                "sprint_qualifying": "#ff8c00",
-                "sprint_shootout": "#ff8c00"
-            }
-            return colors.get(session_type.lower(), "#444") if isinstance(session_type, str) else "#444"
-
-        today = pd.Timestamp(datetime.now())
-        past_sessions = []
-        future_sessions = []
-
-        for _, session in sessions_df.iterrows():
-            session_date = session["date"]
-            session_dict = session.to_dict()
-
-            if pd.isna(session_date):
-                future_sessions.append(session_dict)
-            elif session_date < today:
-                past_sessions.append(session_dict)
-            else:
-                future_sessions.append(session_dict)
+        dates = sessions_df["date"].to_numpy(dtype="datetime64[ns]")
+        today = np.datetime64(datetime.now(), "ns")
+
+        # Sessions without a date are treated as upcoming
+        mask_past = ~np.isnat(dates) & (dates < today)
+        past_sessions = sessions_df[mask_past].to_dict("records")
+        future_sessions = sessions_df[~mask_past].to_dict("records")
 
         if past_sessions:
             st.subheader("Past Sessions")
+            html_parts = []
             for session in past_sessions:
-                formatted_time = format_datetime(session["date"])
-                session_color = get_session_color(session.get("session_type"))
+                formatted_time = session["formatted"]
+                session_color = session["color"]
 
-                st.markdown(f"""
+                html_parts.append(f"""
                 <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
                     <h3>{session['name']}</h3>
                     <p>📅 {formatted_time}</p>
                     <p>Completed</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            st.markdown("\n".join(html_parts), unsafe_allow_html=True)
 
         if future_sessions:
             st.subheader("Upcoming Sessions")
-            for session in future_sessions:
-                formatted_time = format_datetime(session["date"])
-                session_color = get_session_color(session.get("session_type"))
-
-                session_weather = None
-                if pd.notna(session["date"]):
-                    try:
-                        session_weather = get_weather_for_location(event_location, session["date"].isoformat())
-                    except Exception as weather_e:
-                        session_weather = None
-
-                if session_weather:
-                    st.markdown(f"""
-                    <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
-                        <h3>{session['name']}</h3>
-                        <p>📅 {formatted_time}</p>
-                        <div style="display: flex; gap: 20px; font-size: 16px;">
-                            <span>🌡️ <b>{session_weather.get('temperature', 'N/A')}°C</b></span>
-                            <span>🔥 <b>{session_weather.get('track_temperature', 'N/A')}°C</b></span>
-                            <span>💨 <b>{session_weather.get('wind_speed', 'N/A')} km/h</b></span>
-                            <span>☁️ <b>{session_weather.get('cloud_cover', 'N/A')}%</b></span>
-                            <span>🌧️ <b>{'Yes' if session_weather.get('rainfall', False) else 'No'}</b></span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style="border-left: 6px solid {session_color}; padding: 10px; border-radius: 8px; margin-bottom: 8px; background-color: #222;">
-                        <h3>{session['name']}</h3>
-                        <p>📅 {formatted_time}</p>
-                        <p>⚠️ Weather data unavailable.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            _render_weather_cards(future_sessions, event_location)
 
         if not past_sessions and not future_sessions:
             st.info("No session schedule information available.")
@@ -138,4 +176,5 @@ def event_schedule():
     except Exception as e:
         st.error(f"⚠️ Unexpected error: {e}")
 
-event_schedule()
\ No newline at end of file
+if __name__ == "__main__":
+    event_schedule()
@@ -3,11 +3,47 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
+from frontend.components.common_visualizations import show_dataframe_preview
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
+
+START_FUEL_KG = np.float32(110)  # 110kg start estimate
+FUEL_CORRECTION_FACTOR = np.float32(0.035)  # Estimated lap time loss per kg of fuel
+
+LAP_DTYPES = {"driver_name": "string", "lap_time": "float32", "tyre_life": "float32"}
+
+@st.cache_data(ttl=300)
+def _cached_years():
+    return data_service.get_available_years()
+
+@st.cache_data(ttl=300)
+def _event_options(year):
+    """Event names and ids for a season as parallel lists, built once per year."""
+    events_df = pd.DataFrame(data_service.get_events(year))
+    if events_df.empty:
+        return [], []
+    return events_df["event_name"].tolist(), [int(event_id) for event_id in events_df["id"]]
+
+@st.cache_data(ttl=300)
+def _race_session_options(event_id):
+    """Race session names and ids for an event as parallel lists, built once per event."""
+    sessions_df = pd.DataFrame(data_service.get_race_sessions(event_id))
+    if sessions_df.empty:
+        return [], []
+    return sessions_df["name"].tolist(), [int(session_id) for session_id in sessions_df["id"]]
+
+@st.cache_data(ttl=300)
+def _cached_lap_times(session_id):
+    laps_df = data_service.get_fuel_load_laps(session_id)
+    if laps_df.empty:
+        return laps_df
+
+    # Lap times are stored as timedelta strings; keep them as float32 seconds and names as pandas strings
+    laps_df["lap_time"] = pd.to_timedelta(laps_df["lap_time"], errors="coerce").dt.total_seconds()
+    return laps_df.astype({col: dtype for col, dtype in LAP_DTYPES.items() if col in laps_df.columns})
 
 def fuel_load_analysis():
     """Fuel Load & Degradation Impact Analysis."""
@@ -15,35 +51,37 @@ def fuel_load_analysis():
 
     try:
         # Fetch available years
-        available_years = data_service.get_available_years()
+        available_years = _cached_years()
         selected_year = st.selectbox("Select Season", available_years, index=available_years.index(st.session_state.get("selected_year", available_years[0])))
         st.session_state["selected_year"] = selected_year
 
         # Fetch events
-        events = data_service.get_events(selected_year)
-        if not events:
+        event_names, event_ids = _event_options(selected_year)
+        if not event_ids:
             st.warning("No events available.")
             return
 
-        event_options = {event["event_name"]: event["id"] for event in events}
-        selected_event = st.selectbox("Select Event", event_options.keys(), index=list(event_options.values()).index(st.session_state.get("selected_event", next(iter(event_options.values())))))
-        event_id = event_options[selected_event]
+        default_event = st.session_state.get("selected_event")
+        event_index = event_ids.index(default_event) if default_event in event_ids else 0
+        selected_event_idx = st.selectbox("Select Event", range(len(event_ids)), index=event_index, format_func=lambda i: event_names[i])
+        event_id = event_ids[selected_event_idx]
         st.session_state["selected_event"] = event_id
 
         # Fetch race sessions
-        sessions = data_service.get_race_sessions(event_id)
-        if not sessions:
+        session_names, session_ids = _race_session_options(event_id)
+        if not session_ids:
             st.warning("No race sessions available.")
             return
 
-        session_options = {session["name"]: session["id"] for session in sessions}
-        selected_session = st.selectbox("Select Session", session_options.keys(), index=list(session_options.values()).index(st.session_state.get("selected_session", next(iter(session_options.values())))))
-        session_id = session_options[selected_session]
+        default_session = st.session_state.get("selected_session")
+        session_index = session_ids.index(default_session) if default_session in session_ids else 0
+        selected_session_idx = st.selectbox("Select Session", range(len(session_ids)), index=session_index, format_func=lambda i: session_names[i])
+        session_id = session_ids[selected_session_idx]
         st.session_state["selected_session"] = session_id
 
         # Fetch lap data
-        laps_df = data_service.get_lap_times(session_id)
-        if not laps_df or (isinstance(laps_df, pd.DataFrame) and laps_df.empty):
+        laps_df = _cached_lap_times(session_id)
+        if laps_df is None or laps_df.empty:
             st.warning("No lap data available.")
             return
 
@@ -64,7 +102,14 @@ def fuel_load_analysis():
 
         # Display dataset
         st.subheader("📊 Fuel Load Analysis Data")
-        st.dataframe(laps_df, use_container_width=True)
+        show_dataframe_preview(
+            laps_df,
+            "fuel_load_laps.csv",
+            column_config={
+                "estimated_fuel_load": st.column_config.NumberColumn("Fuel Load (kg)", format="%.1f"),
+                "corrected_lap_time": st.column_config.NumberColumn("Corrected Lap Time (s)", format="%.3f"),
+            },
+        )
 
     except DatabaseError as e:
         st.error(f"⚠️ Database error: {e}")
@@ -73,14 +118,17 @@ def fuel_load_analysis():
 
 def estimate_fuel_load(df):
     """Estimates fuel load dynamically based on lap number and degradation trends."""
-    df["estimated_fuel_load"] = np.exp(-df["lap_number"] / 30) * 110  # 110kg start estimate
-    return df["estimated_fuel_load"]
+    laps = df["lap_number"].to_numpy(dtype=np.float32)
+    fuel = np.exp(-laps / np.float32(30))
+    fuel *= START_FUEL_KG
+    return fuel
 
 def normalize_lap_time(df):
     """Applies a fuel correction model to normalize lap times."""
-    fuel_correction_factor = 0.035  # Estimated lap time loss per kg of fuel
-    df["corrected_lap_time"] = df["lap_time"] - (df["estimated_fuel_load"] * fuel_correction_factor)
-    return df["corrected_lap_time"]
+    lap_times = df["lap_time"].to_numpy(dtype=np.float32)
+    corrected = df["estimated_fuel_load"].to_numpy(dtype=np.float32) * FUEL_CORRECTION_FACTOR
+    np.subtract(lap_times, corrected, out=corrected)
+    return corrected
 
 def plot_fuel_load_vs_lap_time(df):
     """Visualizes the effect of fuel load on lap times."""
@@ -89,6 +137,7 @@ def plot_fuel_load_vs_lap_time(df):
         x="estimated_fuel_load",
         y="lap_time",
         color="driver_name",
+        render_mode="webgl",
         title="⛽ Fuel Load vs. Lap Time",
         labels={"estimated_fuel_load": "Fuel Load (kg)", "lap_time": "Lap Time (s)"},
     )
@@ -96,14 +145,26 @@ def plot_fuel_load_vs_lap_time(df):
 
 def plot_actual_vs_corrected_lap_time(df):
     """Compares actual lap times vs. fuel-corrected lap times."""
+    # Melt once up front: actual vs corrected becomes a dash style rather than a wide-form column pair
+    plot_df = df.melt(
+        id_vars=["lap_number", "driver_name"],
+        value_vars=["lap_time", "corrected_lap_time"],
+        var_name="kind",
+        value_name="time",
+    )
+    plot_df["time"] = plot_df["time"].astype("float32")
+
     fig = px.line(
-        df,
+        plot_df,
         x="lap_number",
-        y=["lap_time", "corrected_lap_time"],
+        y="time",
         color="driver_name",
+        line_dash="kind",
+        render_mode="webgl",
         title="📈 Actual vs. Fuel-Corrected Lap Time",
-        labels={"lap_number": "Lap Number", "lap_time": "Lap Time (s)"},
+        labels={"lap_number": "Lap Number", "time": "Lap Time (s)", "kind": "Lap Time"},
     )
     st.plotly_chart(fig, use_container_width=True)
 
-fuel_load_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    fuel_load_analysis()
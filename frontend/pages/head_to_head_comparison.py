@@ -5,43 +5,61 @@ import numpy as np
 import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly.express as px
 from backend.db_connection import get_db_handler
+from frontend.components.common_visualizations import downsample_by_group
+
+# Upper bound on points plotted per driver in the lap-time comparison
+MAX_POINTS_PER_TRACE = 2000
 
 st.set_page_config(layout="wide")
 
 st.title("Head-to-Head Driver Comparison (Multi-Metric Analysis)")
 
-def get_head_to_head_data(session_id, driver1_id, driver2_id):
+def get_head_to_head_data(session_id: int, driver1_id: int, driver2_id: int) -> pd.DataFrame:
     """
     Retrieves lap time comparison data between two drivers.
+    Ids are expected as plain ints from the selectboxes.
     """
-    session_id = int(session_id)
-    driver1_id = int(driver1_id)
-    driver2_id = int(driver2_id)
-    
     query = """
-        SELECT laps.lap_number, drivers.full_name, laps.lap_time
+        SELECT laps.lap_number, drivers.full_name AS driver_name, laps.lap_time,
+               laps.sector1_time AS sector_1_time, laps.sector2_time AS sector_2_time,
+               laps.sector3_time AS sector_3_time
         FROM laps
-        JOIN drivers ON laps.driver_id = drivers.driver_id
+        JOIN drivers ON laps.driver_id = drivers.id
         WHERE laps.session_id = ? AND (laps.driver_id = ? OR laps.driver_id = ?)
         ORDER BY laps.lap_number, drivers.full_name
     """
     
     with get_db_handler() as db:
         df = db.execute_query(query, (session_id, driver1_id, driver2_id))
-    
-    return df
+
+    if df.empty:
+        return df
+
+    # Timedelta strings -> float32 seconds, names -> pandas string dtype
+    time_cols = ["lap_time", "sector_1_time", "sector_2_time", "sector_3_time"]
+    for col in time_cols:
+        df[col] = pd.to_timedelta(df[col], errors="coerce").dt.total_seconds()
+    return df.astype({"driver_name": "string", **{col: "float32" for col in time_cols}})
 
 def plot_lap_time_comparison(df, driver1, driver2):
     """
     Compares lap times between two drivers.
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.lineplot(ax=ax, x="lap_number", y="lap_time", hue="driver_name", data=df)
-    ax.set_xlabel("Lap Number")
-    ax.set_ylabel("Lap Time (s)")
-    ax.set_title(f"Lap Time Comparison: {driver1} vs {driver2}")
-    st.pyplot(fig)
+    plot_df = downsample_by_group(df, "driver_name", "lap_number", "lap_time", MAX_POINTS_PER_TRACE)
+
+    # WebGL traces are drawn client-side instead of rasterising a matplotlib figure on the server
+    fig = px.line(
+        plot_df,
+        x="lap_number",
+        y="lap_time",
+        color="driver_name",
+        render_mode="webgl",
+        title=f"Lap Time Comparison: {driver1} vs {driver2}",
+        labels={"lap_number": "Lap Number", "lap_time": "Lap Time (s)", "driver_name": "Driver"},
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
 def plot_sector_comparison(df):
     """
@@ -84,11 +102,11 @@ def plot_overtake_comparison(df):
 # Fetch session and driver data
 with get_db_handler() as db:
     sessions = db.execute_query("SELECT DISTINCT session_id FROM laps")
-    drivers = db.execute_query("SELECT DISTINCT driver_id, full_name FROM drivers")
+    drivers = db.execute_query("SELECT DISTINCT id AS driver_id, full_name FROM drivers WHERE full_name IS NOT NULL")
 
-session_list = [int(session["session_id"]) for session in sessions if isinstance(session, dict) and "session_id" in session]
-driver_dict = {int(driver["driver_id"]): driver["driver_name"] for driver in drivers 
-              if isinstance(driver, dict) and "driver_id" in driver and driver["driver_id"] and str(driver["driver_id"]).strip()}
+# Build the option lists column-wise; ids become plain ints here so the query helper needn't cast them
+session_list = sessions["session_id"].dropna().astype(int).tolist() if not sessions.empty else []
+driver_dict = dict(zip(drivers["driver_id"].astype(int).tolist(), drivers["full_name"])) if not drivers.empty else {}
 selected_session = st.selectbox("Select Session", session_list if session_list else [0])
 selected_driver1 = st.selectbox("Select Driver 1", driver_dict.keys(), format_func=lambda x: driver_dict[x])
 selected_driver2 = st.selectbox("Select Driver 2", driver_dict.keys(), format_func=lambda x: driver_dict[x])
@@ -96,11 +114,14 @@ selected_driver2 = st.selectbox("Select Driver 2", driver_dict.keys(), format_fu
 if selected_driver1 != selected_driver2:
     df = get_head_to_head_data(selected_session, selected_driver1, selected_driver2)
     
-    if not df or (isinstance(df, pd.DataFrame) and df.empty):
-        plot_lap_time_comparison(df)
+    if not df.empty:
+        plot_lap_time_comparison(df, driver_dict[selected_driver1], driver_dict[selected_driver2])
         plot_sector_comparison(df)
-        plot_pit_stop_comparison(df)
-        plot_overtake_comparison(df)
+        # Pit stop and overtake data are not part of the laps query; only plot them when present
+        if "stop_time" in df.columns:
+            plot_pit_stop_comparison(df)
+        if "overtake_position" in df.columns:
+            plot_overtake_comparison(df)
         
         st.write("### Head-to-Head Data")
         st.dataframe(df)
@@ -1,28 +1,72 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-from frontend.components.countdown import get_next_event, display_countdown
-from backend.data_service import F1DataService
+from frontend.components.countdown import display_countdown
+from frontend.data_service import get_data_service
+from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_years():
+    return data_service.get_available_years()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_season(year):
+    """Season events, fetched once per hour for the current-event check and events table.
+
+    event_date stays an ISO string for the day comparisons; end_date comes from
+    SQLite as YYYY-MM-DD.
+    """
+    return data_service.get_season_overview(year)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _next_event(year):
+    """Next event of the season, picked by an indexed LIMIT 1 query.
+
+    The short TTL keeps the countdown moving on to the following event soon after
+    a start time passes.
+    """
+    upcoming = data_service.get_upcoming_events(year, limit=1)
+    if upcoming.empty:
+        return None
+
+    event = upcoming.iloc[0].to_dict()
+    event['event_date_dt'] = pd.to_datetime(event['event_date'], errors='coerce', format='ISO8601')
+    return event
+
+@st.cache_data(ttl=300)
+def _cached_sessions(event_id):
+    return data_service.get_sessions(event_id)
 
 def home():
     st.title("🏠 F1 Dashboard Home")
 
-    years = data_service.get_available_years()
+    years = _cached_years()
     year = st.selectbox("Select Season", years)
 
-    events = data_service.get_events(year)
-    events_df = pd.DataFrame(events) if events else pd.DataFrame()
+    # ISO dates sort lexicographically, so "today" as a string is all the comparisons below need
+    today_str = datetime.now().strftime('%Y-%m-%d')
+
+    # Reuse this session's schedule on unrelated reruns instead of copying it out of the cache again.
+    # Only the schedule is kept; the next event is looked up separately on every rerun.
+    season_key = (year, today_str)
+    try:
+        if st.session_state.get('home_season_key') != season_key:
+            st.session_state['home_season'] = load_season(year)
+            st.session_state['home_season_key'] = season_key
+        next_event = _next_event(year)
+    except DatabaseError as e:
+        st.error(f"Error fetching season data: {e}")
+        return
+    events_df = st.session_state['home_season']
 
     if not events_df.empty:
-        events_df['event_date'] = pd.to_datetime(events_df['event_date'], errors='coerce')
-        today = pd.Timestamp(datetime.now().date())
 
         # Identify current event
-        events_df['end_date'] = events_df['event_date'] + pd.Timedelta(days=3)
-        current_event = events_df[(events_df['event_date'] <= today) & (events_df['end_date'] >= today)]
+        event_day = events_df['event_date'].str[:10]
+        current_event = events_df[(event_day <= today_str) & (events_df['end_date'] >= today_str)]
 
         if not current_event.empty:
             current_event_info = current_event.iloc[0].to_dict()
@@ -31,25 +75,25 @@ def home():
                 <div style="padding: 15px; border-radius: 8px; background-color: #228b22; color: white;">
                     <h2>{current_event_info['event_name']}</h2>
                     <p>{current_event_info['country']} | Round {current_event_info['round_number']}</p>
-                    <p>{current_event_info['event_date'].strftime('%d %b %Y')} - {(current_event_info['end_date']).strftime('%d %b %Y')}</p>
+                    <p>{pd.Timestamp(current_event_info['event_date']).strftime('%d %b %Y')} - {pd.Timestamp(current_event_info['end_date']).strftime('%d %b %Y')}</p>
                 </div>
             """, unsafe_allow_html=True)
 
-            sessions = data_service.get_sessions(current_event_info['id'])
-            sessions_df = pd.DataFrame(sessions) if sessions else pd.DataFrame()
-            sessions_df['date'] = pd.to_datetime(sessions_df['date'], errors='coerce')
-            current_session = sessions_df[(sessions_df['date'].dt.date == today.date())]
+            sessions_df = _cached_sessions(current_event_info['id'])
+            if sessions_df is None or sessions_df.empty:
+                current_session = pd.DataFrame()
+            else:
+                current_session = sessions_df[sessions_df['date'].str[:10] == today_str]
 
             if not current_session.empty:
                 current_session_info = current_session.iloc[0].to_dict()
                 st.markdown(f"""
                     <div style="padding: 10px; border-radius: 8px; background-color: #444; color: white; margin-top: 10px;">
                         <h4>Current Session: {current_session_info['name']}</h4>
-                        <p>{current_session_info['session_type'].title()} - {current_session_info['date'].strftime('%H:%M')}</p>
+                        <p>{current_session_info['session_type'].title()} - {pd.Timestamp(current_session_info['date']).strftime('%H:%M')}</p>
                     </div>
                 """, unsafe_allow_html=True)
 
-        next_event = get_next_event(events_df)
         if next_event:
             st.subheader("⏳ Next Event Countdown")
             display_countdown(next_event)
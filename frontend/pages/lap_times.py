@@ -3,113 +3,369 @@ import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
 
-from backend.data_service import F1DataService
+from frontend.components.common_visualizations import downsample_by_group
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError, ResourceNotFoundError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
+
+# Marker colour per tire compound
+_COMPOUND_COLORS = {
+    "S": "red",
+    "M": "yellow",
+    "H": "white",
+    "I": "green",
+    "W": "blue"
+}
+
+# Shared styling for every plot on the page; the comparison chart only overrides the height
+_COMMON_LAYOUT = dict(
+    hovermode="closest",
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="white"),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    height=500
+)
+
+# Stored time strings and the float-seconds columns derived from them
+TIME_COLUMNS = {
+    "lap_time": "lap_time_sec",
+    "sector1_time": "sector1_sec",
+    "sector2_time": "sector2_sec",
+    "sector3_time": "sector3_sec"
+}
+
+# Low-cardinality label columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("driver_name", "team_name", "team_color", "compound")
+
+# Line colour for drivers whose team (or team colour) is missing
+DEFAULT_DRIVER_COLOR = "#888888"
+
+# Upper bound on points per plotted trace; longer series are LTTB-downsampled
+MAX_POINTS_PER_TRACE = 500
+
+# Optional "N days " prefix, then [[hours:]minutes:]seconds; hours only count when minutes are present
+_TIME_PATTERN = r"^(?:(\d+) days? )?(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)$"
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_years():
+    return data_service.get_available_years()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _event_options(year):
+    """Event names and ids for a season as parallel lists, built once per year."""
+    events_df = pd.DataFrame(data_service.get_events(year))
+    if events_df.empty:
+        return [], []
+    return events_df["event_name"].tolist(), [int(event_id) for event_id in events_df["id"]]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _session_options(event_id):
+    """Session names and ids for an event as parallel lists, built once per event."""
+    sessions_df = pd.DataFrame(data_service.get_sessions(event_id))
+    if sessions_df.empty:
+        return [], []
+    return sessions_df["name"].tolist(), [int(session_id) for session_id in sessions_df["id"]]
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_lap_times(session_id):
+    """
+    Non-deleted laps for a session, ready to plot: times parsed to seconds and labels made categorical.
+    Cached so neither the query nor the preprocessing reruns on widget interactions.
+    """
+    laps_df = data_service.get_session_laps(session_id)
+    if laps_df is None or laps_df.empty:
+        return laps_df
+
+    for source, target in TIME_COLUMNS.items():
+        laps_df[target] = convert_time_column(laps_df[source])
+
+    # Small integer keys; stint stays float when it has gaps
+    for col in ("lap_number", "stint"):
+        laps_df[col] = pd.to_numeric(laps_df[col], downcast="integer")
+
+    # Seconds and tyre age only need float32 precision, halving what every mask and groupby reads
+    dtypes = {col: "float32" for col in (*TIME_COLUMNS.values(), "tyre_life")}
+    # Repeatedly filtered/grouped labels become categoricals, so isin/==/groupby work on integer codes
+    dtypes.update({col: "category" for col in CATEGORICAL_COLUMNS if col in laps_df.columns})
+    return laps_df.astype(dtypes)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_stint_summary(session_id, drivers):
+    """
+    Per-stint lap count, min/avg time and degradation for the selected drivers' valid laps.
+    Keyed by (session_id, drivers) so the aggregation only reruns when the selection changes.
+    """
+    laps_df = _cached_lap_times(session_id)
+    valid = laps_df[laps_df["driver_name"].isin(drivers)]
+
+    # Calculate stint statistics in one grouped aggregation
+    stints = (
+        valid.groupby(["driver_name", "stint"], sort=False, observed=True)
+        .agg(
+            compound=("compound", "first"),
+            laps=("lap_time_sec", "size"),
+            min_time=("lap_time_sec", "min"),
+            max_time=("lap_time_sec", "max"),
+            avg_time=("lap_time_sec", "mean")
+        )
+        .reset_index()
+    )
+    stints = stints[stints["laps"] > 1]  # Only include stints with at least 2 laps
+
+    degradation = (stints["max_time"] - stints["min_time"]) / stints["laps"]
+    return pd.DataFrame({
+        "Driver": stints["driver_name"],
+        "Stint": stints["stint"].astype(int),
+        "Compound": stints["compound"].astype(object).fillna("Unknown"),
+        "Laps": stints["laps"],
+        "Min Time": format_seconds_series(stints["min_time"]),
+        "Avg Time": format_seconds_series(stints["avg_time"]),
+        "Deg/Lap": degradation.map("{:.3f}s".format)
+    })
+
+
+# Figure builders are cached per (session, selection), so reruns that keep the same selection skip
+# re-adding every trace; st.cache_data hands each caller its own copy of the figure.
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _lap_time_figure(session_id, drivers):
+    laps_df = _cached_lap_times(session_id)
+    driver_colors = driver_color_map(laps_df)
+    filtered_df = laps_df[laps_df["driver_name"].isin(drivers)]
+
+    fig = go.Figure()
+    plot_df = downsample_by_group(filtered_df, "driver_name", "lap_number", "lap_time_sec", MAX_POINTS_PER_TRACE)
+
+    # Plain arrays go straight into the trace without Plotly re-validating a Series
+    for driver, driver_data in plot_df.groupby("driver_name", sort=False, observed=True):
+        fig.add_trace(go.Scattergl(
+            x=driver_data["lap_number"].to_numpy(),
+            y=driver_data["lap_time_sec"].to_numpy(),
+            mode="lines+markers",
+            name=driver,
+            line=dict(color=driver_colors[driver], width=2)
+        ))
+
+    fig.update_layout(
+        title="Lap Times Evolution",
+        xaxis_title="Lap Number",
+        yaxis_title="Lap Time (seconds)",
+        yaxis=dict(autorange="reversed"),
+        uirevision=f"{session_id}-laps",
+        **_COMMON_LAYOUT
+    )
 
-st.title("⏱ Lap Times Analysis")
+    return fig
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _sector_figure(session_id, drivers, sector, sector_col):
+    laps_df = _cached_lap_times(session_id)
+    driver_colors = driver_color_map(laps_df)
+    filtered_df = laps_df[laps_df["driver_name"].isin(drivers) & laps_df[sector_col].notna()]
+
+    # Create sector time visualization
+    fig = go.Figure()
+    plot_df = downsample_by_group(filtered_df, "driver_name", "lap_number", sector_col, MAX_POINTS_PER_TRACE)
+    
+    # Add a line for each driver, partitioning the frame once instead of masking per driver
+    for driver, driver_data in plot_df.groupby("driver_name", sort=False, observed=True):
+        if not driver_data[sector_col].isna().all():
+            team_color = driver_colors[driver]
+            
+            fig.add_trace(go.Scattergl(
+                x=driver_data["lap_number"].to_numpy(),
+                y=driver_data[sector_col].to_numpy(),
+                mode="lines+markers",
+                name=driver,
+                line=dict(color=team_color, width=2),
+                marker=dict(
+                    size=8,
+                    color=team_color,
+                    symbol="circle"
+                ),
+                hovertemplate=(
+                    f"Driver: {driver}<br>"
+                    "Lap: %{x}<br>"
+                    f"{sector} Time: %{{y:.3f}}s<br>"
+                    "Tire: %{customdata[0]}"
+                ),
+                customdata=driver_data[["compound"]].to_numpy()
+            ))
+    
+    # Update layout
+    fig.update_layout(
+        title=f"{sector} Times",
+        xaxis_title="Lap Number",
+        yaxis_title=f"{sector} Time (seconds)",
+        yaxis=dict(autorange="reversed"),  # Lower times at the top
+        uirevision=f"{session_id}-sectors",
+        **_COMMON_LAYOUT
+    )
+
+    return fig
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _tire_figure(session_id, drivers):
+    laps_df = _cached_lap_times(session_id)
+    filtered_df = laps_df[laps_df["driver_name"].isin(drivers)]
+
+    # Create tire degradation visualization
+    fig = go.Figure()
+    # Min/max bucketing keeps the slowest and fastest laps of each tyre-age window visible
+    plot_df = downsample_by_group(
+        filtered_df, ["driver_name", "stint"], "tyre_life", "lap_time_sec", MAX_POINTS_PER_TRACE, method="m4"
+    )
+    
+    # One trace per compound; stints are joined into it with NaN gaps so each one draws as its own line
+    compounds = plot_df["compound"].astype(object).fillna("Unknown")
+    for compound, compound_data in plot_df.groupby(compounds, sort=False):
+        drivers_arr = compound_data["driver_name"].to_numpy(dtype=object)
+        stints_arr = compound_data["stint"].to_numpy()
+        breaks = np.flatnonzero((drivers_arr[1:] != drivers_arr[:-1]) | (stints_arr[1:] != stints_arr[:-1])) + 1
+        
+        marker_color = _COMPOUND_COLORS.get(compound, "grey")
+        
+        fig.add_trace(go.Scattergl(
+            x=np.insert(compound_data["tyre_life"].to_numpy(dtype="float64"), breaks, np.nan),
+            y=np.insert(compound_data["lap_time_sec"].to_numpy(dtype="float64"), breaks, np.nan),
+            mode="lines+markers",
+            name=compound,
+            line=dict(color=marker_color, width=2),
+            marker=dict(
+                size=8,
+                color=marker_color,
+                symbol="circle"
+            ),
+            hovertemplate=(
+                "Driver: %{customdata[0]}<br>"
+                "Tire Life: %{x} laps<br>"
+                "Lap Time: %{y:.3f}s<br>"
+                f"Compound: {compound}<br>"
+                "Lap: %{customdata[1]}"
+            ),
+            customdata=np.insert(
+                compound_data[["driver_name", "lap_number"]].to_numpy(dtype=object), breaks, None, axis=0
+            )
+        ))
+
+    # Update layout
+    fig.update_layout(
+        title="Tire Degradation Analysis",
+        xaxis_title="Tire Life (laps)",
+        yaxis_title="Lap Time (seconds)",
+        yaxis=dict(autorange="reversed"),  # Lower times at the top
+        uirevision=f"{session_id}-tires",
+        **_COMMON_LAYOUT
+    )
+
+    return fig
 
 
 def lap_times():
+    st.title("⏱ Lap Times Analysis")
+
     try:
-        years = data_service.get_available_years()
+        years = _cached_years()
         default_year = st.session_state.get("selected_year", years[0])
         year = st.selectbox("Select Season", options=years, index=years.index(default_year), key="laptimes_year")
         st.session_state["selected_year"] = year
 
-        events = data_service.get_events(year)
-        event_options = {event["event_name"]: event["id"] for event in events}
-
-        if not events:
+        event_names, event_ids = _event_options(year)
+        if not event_ids:
             st.warning("No events available.")
             return
 
-        default_event = st.session_state.get("selected_event", next(iter(event_options.values())))
-        if default_event not in event_options.values():
-            default_event = next(iter(event_options.values()))
-
-        selected_event = st.selectbox("Select Event", options=event_options.keys(),
-                                      index=list(event_options.values()).index(default_event),
-                                      key="laptimes_event")
-        event_id = event_options[selected_event]
+        default_event = st.session_state.get("selected_event")
+        event_index = event_ids.index(default_event) if default_event in event_ids else 0
+        selected_event_idx = st.selectbox("Select Event", range(len(event_ids)), index=event_index,
+                                          format_func=lambda i: event_names[i], key="laptimes_event")
+        event_id = event_ids[selected_event_idx]
         st.session_state["selected_event"] = event_id
 
-        sessions = data_service.get_sessions(event_id)
-        session_options = {session["name"]: session["id"] for session in sessions}
-
-        if not sessions:
+        session_names, session_ids = _session_options(event_id)
+        if not session_ids:
             st.warning("No sessions available for this event.")
             return
 
-        default_session = st.session_state.get("selected_session", next(iter(session_options.values())))
-        if default_session not in session_options.values():
-            default_session = next(iter(session_options.values()))
-
-        selected_session = st.selectbox("Select Session", options=session_options.keys(),
-                                        index=list(session_options.values()).index(default_session),
-                                        key="laptimes_session")
-        session_id = session_options[selected_session]
+        default_session = st.session_state.get("selected_session")
+        session_index = session_ids.index(default_session) if default_session in session_ids else 0
+        selected_session_idx = st.selectbox("Select Session", range(len(session_ids)), index=session_index,
+                                            format_func=lambda i: session_names[i], key="laptimes_session")
+        session_id = session_ids[selected_session_idx]
         st.session_state["selected_session"] = session_id
 
-        laps_df = data_service.get_lap_times(session_id)
-        laps_df = pd.DataFrame(laps_df) if laps_df else pd.DataFrame()
-        if laps_df.empty:
+        laps_df = _cached_lap_times(session_id)
+        if laps_df is None or laps_df.empty:
             st.warning("No lap time data available for this session.")
             return
 
-        laps_df["lap_time_sec"] = laps_df["lap_time"].apply(convert_time_to_seconds)
-        laps_df["sector1_sec"] = laps_df["sector1_time"].apply(convert_time_to_seconds)
-        laps_df["sector2_sec"] = laps_df["sector2_time"].apply(convert_time_to_seconds)
-        laps_df["sector3_sec"] = laps_df["sector3_time"].apply(convert_time_to_seconds)
+        # Team colour per driver for the comparison tab; the cached figure builders derive their own
+        driver_colors = driver_color_map(laps_df)
+
+        # One driver filter shared by the lap, sector and tire tabs, so they filter and cache on the same key
+        st.sidebar.subheader("Lap Times Filters")
+        drivers = laps_df["driver_name"].unique().tolist()
+        selected_drivers = tuple(st.sidebar.multiselect("Select Drivers", drivers, default=drivers[:5],
+                                                        key="laptimes_drivers"))
 
         tab1, tab2, tab3, tab4, tab5 = st.tabs(["Lap Times", "Fastest Laps", "Sector Analysis", "Tire Analysis", "Driver Comparison"])
 
         with tab1:
-            show_lap_time_analysis(laps_df)
+            show_lap_time_analysis(session_id, selected_drivers)
 
         with tab2:
             show_fastest_laps(laps_df)
 
         with tab3:
-            show_sector_analysis(laps_df)
+            show_sector_analysis(laps_df, session_id, selected_drivers)
 
         with tab4:
-            show_tire_analysis(laps_df)
+            show_tire_analysis(session_id, selected_drivers)
 
         with tab5:
-            show_driver_comparison(laps_df)
+            show_driver_comparison(laps_df, session_id, driver_colors)
 
     except (DatabaseError, ResourceNotFoundError) as e:
         st.error(f"Error fetching lap times: {e}")
     except Exception as e:
         st.error(f"Unexpected error: {e}")
 
-def convert_time_to_seconds(time_str):
-    try:
-        if pd.isna(time_str):
-            return None
-        if ':' in time_str:
-            minutes, seconds = map(float, time_str.split(':'))
-            return minutes * 60 + seconds
-        return float(time_str)
-    except:
-        return None
-
-def show_sector_analysis(laps_df):
+def driver_color_map(laps_df):
+    """Maps each driver to their team colour, falling back to DEFAULT_DRIVER_COLOR when it is missing."""
+    colors = laps_df.drop_duplicates("driver_name").set_index("driver_name")["team_color"]
+    return colors.astype(object).fillna(DEFAULT_DRIVER_COLOR).to_dict()
+
+def convert_time_column(times):
+    """
+    Convert a column of time strings to float seconds in one vectorised pass.
+    Handles "0 days 00:01:32.123000" (str of a Timedelta), "1:32.123" and plain "92.123";
+    anything else becomes NaN.
+    """
+    # Already-parsed columns skip the regex entirely
+    if pd.api.types.is_numeric_dtype(times):
+        return times.astype("float64")
+    if pd.api.types.is_timedelta64_dtype(times):
+        return times.dt.total_seconds()
+
+    parts = times.astype(str).str.strip().str.extract(_TIME_PATTERN).astype("float64")
+    days, hours, minutes, seconds = (parts[i] for i in range(4))
+    return days.fillna(0) * 86400 + hours.fillna(0) * 3600 + minutes.fillna(0) * 60 + seconds
+
+def show_sector_analysis(laps_df, session_id, selected_drivers):
     """Show sector time analysis visualization."""
     st.subheader("Sector Analysis")
     
-    # Sidebar filters
-    st.sidebar.subheader("Sector Analysis Filters")
-    
-    # Get unique drivers
-    drivers = laps_df["driver_name"].unique().tolist()
-    
-    # Allow user to select drivers
-    selected_drivers = st.sidebar.multiselect("Select Drivers (Sectors)", drivers, default=drivers[:3] if len(drivers) > 3 else drivers)
-    
     # Select sector
     sector = st.selectbox("Select Sector", ["Sector 1", "Sector 2", "Sector 3"])
     
@@ -124,243 +380,70 @@ def show_sector_analysis(laps_df):
     
     # Apply filtering
     filtered_df = laps_df[laps_df["driver_name"].isin(selected_drivers)]
-    filtered_df = filtered_df[~(filtered_df["deleted"] == 1)]
     filtered_df = filtered_df[pd.notna(filtered_df[sector_col])]
     
-    if not filtered_df or (isinstance(filtered_df, pd.DataFrame) and filtered_df.empty):
+    if filtered_df.empty:
         st.warning("No sector data available with the current filters.")
         return
     
-    # Create sector time visualization
-    fig = go.Figure()
-    
-    # Add a line for each driver
-    for driver in selected_drivers:
-        driver_data = filtered_df[filtered_df["driver_name"] == driver]
-        if not driver_data.empty and not driver_data[sector_col].isna().all():
-            team_color = driver_data["team_color"].iloc[0]
-            
-            fig.add_trace(go.Scatter(
-                x=driver_data["lap_number"],
-                y=driver_data[sector_col],
-                mode="lines+markers",
-                name=driver,
-                line=dict(color=team_color, width=2),
-                marker=dict(
-                    size=8,
-                    color=team_color,
-                    symbol="circle"
-                ),
-                hovertemplate=(
-                    f"Driver: {driver}<br>"
-                    "Lap: %{x}<br>"
-                    f"{sector} Time: %{{y:.3f}}s<br>"
-                    "Tire: %{customdata[0]}"
-                ),
-                customdata=np.column_stack((driver_data["compound"],))
-            ))
-    
-    # Update layout
-    fig.update_layout(
-        title=f"{sector} Times",
-        xaxis_title="Lap Number",
-        yaxis_title=f"{sector} Time (seconds)",
-        yaxis=dict(autorange="reversed"),  # Lower times at the top
-        hovermode="closest",
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="white"),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        height=500
-    )
+    fig = _sector_figure(session_id, selected_drivers, sector, sector_col)
     
     st.plotly_chart(fig, use_container_width=True)
     
     # Show best sector times
     st.subheader(f"Best {sector} Times")
     
-    # Get best sector time for each driver
-    best_sectors = []
-    for driver in selected_drivers:
-        driver_data = filtered_df[filtered_df["driver_name"] == driver]
-        if not driver_data.empty and not driver_data[sector_col].isna().all():
-            best_sector = driver_data.loc[driver_data[sector_col].idxmin()]
-            best_sectors.append({
-                "Driver": best_sector["driver_name"],
-                "Lap": int(best_sector["lap_number"]),
-                f"{sector} Time": f"{best_sector[sector_col]:.3f}s",
-                "Time_Sec": best_sector[sector_col],
-                "Compound": best_sector["compound"],
-                "Team": best_sector["team_name"]
-            })
-    
-    if best_sectors:
-        # Sort by sector time
-        best_sectors_df = pd.DataFrame(best_sectors).sort_values("Time_Sec")
-        
-        # Calculate delta to fastest
-        if not best_sectors_df or (isinstance(best_sectors_df, pd.DataFrame) and best_sectors_df.empty):
-            st.warning("No delta for best sectors!")
-            fastest_time = best_sectors_df["Time_Sec"].min()
-            best_sectors_df["Delta"] = best_sectors_df["Time_Sec"].apply(
-                lambda x: f"+{(x - fastest_time):.3f}s" if x > fastest_time else "Leader"
-            )
-        
-        # Display dataframe without the Time_Sec column
-        st.dataframe(
-            best_sectors_df.drop("Time_Sec", axis=1),
-            use_container_width=True,
-            hide_index=True
-        )
-    else:
+    # Best sector time for each driver: one stable sort, then keep each driver's first row
+    best = filtered_df.sort_values(sector_col, kind="stable").drop_duplicates("driver_name")
+    best_sectors_df = pd.DataFrame({
+        "Driver": best["driver_name"],
+        "Lap": best["lap_number"].astype(int),
+        f"{sector} Time": best[sector_col].map("{:.3f}s".format),
+        "Time_Sec": best[sector_col],
+        "Compound": best["compound"],
+        "Team": best["team_name"]
+    })
+    
+    if best_sectors_df.empty:
         st.info(f"No valid {sector} times to display.")
+        return
+    
+    # Calculate delta to fastest
+    delta = best_sectors_df["Time_Sec"] - best_sectors_df["Time_Sec"].min()
+    best_sectors_df["Delta"] = np.where(delta > 0, "+" + delta.map("{:.3f}".format) + "s", "Leader")
+    
+    # Display dataframe without the Time_Sec column
+    st.dataframe(
+        best_sectors_df.drop("Time_Sec", axis=1),
+        use_container_width=True,
+        hide_index=True
+    )
 
-def show_tire_analysis(laps_df):
+def show_tire_analysis(session_id, selected_drivers):
     """Show tire and stint analysis visualization."""
     st.subheader("Tire and Stint Analysis")
     
-    # Sidebar filters
-    st.sidebar.subheader("Tire Analysis Filters")
-    
-    # Get unique drivers
-    drivers = laps_df["driver_name"].unique().tolist()
-    
-    # Allow user to select drivers
-    selected_drivers = st.sidebar.multiselect("Select Drivers (Tires)", drivers, default=drivers[:3] if len(drivers) > 3 else drivers)
-    
-    # Filter data
-    filtered_df = laps_df[laps_df["driver_name"].isin(selected_drivers)]
-    filtered_df = filtered_df[~(filtered_df["deleted"] == 1)]
-    
-    if not filtered_df or (isinstance(filtered_df, pd.DataFrame) and filtered_df.empty):
+    # Every listed driver has laps, so an empty selection is the only empty case
+    if not selected_drivers:
         st.warning("No tire data available with the current filters.")
         return
     
-    # Create tire degradation visualization
-    fig = go.Figure()
-    
-    # Create a color map for tire compounds
-    compound_colors = {
-        "S": "red",
-        "M": "yellow",
-        "H": "white",
-        "I": "green",
-        "W": "blue"
-    }
-    
-    # Add a scatter point for each lap
-    for driver in selected_drivers:
-        driver_data = filtered_df[filtered_df["driver_name"] == driver]
-        if not driver_data.empty and not driver_data["lap_time_sec"].isna().all():
-            team_color = driver_data["team_color"].iloc[0]
-            
-            # Group by stint
-            stints = driver_data["stint"].unique()
-            
-            for stint in stints:
-                stint_data = driver_data[driver_data["stint"] == stint]
-                if not stint_data or (isinstance(stint_data, pd.DataFrame) and stint_data.empty):
-                    st.warning("No stint data available!")
-                    # Get compound for this stint
-                    compound = stint_data["compound"].iloc[0] if pd.notna(stint_data["compound"].iloc[0]) else "Unknown"
-                    
-                    # Create a name for the legend that includes driver and compound
-                    name = f"{driver} - {compound}"
-                    
-                    # Choose marker color based on compound
-                    marker_color = compound_colors.get(compound, team_color)
-                    
-                    fig.add_trace(go.Scatter(
-                        x=stint_data["tyre_life"],
-                        y=stint_data["lap_time_sec"],
-                        mode="lines+markers",
-                        name=name,
-                        line=dict(color=marker_color, width=2),
-                        marker=dict(
-                            size=8,
-                            color=marker_color,
-                            symbol="circle"
-                        ),
-                        hovertemplate=(
-                            f"Driver: {driver}<br>"
-                            "Tire Life: %{x} laps<br>"
-                            "Lap Time: %{y:.3f}s<br>"
-                            f"Compound: {compound}<br>"
-                            "Lap: %{customdata[0]}"
-                        ),
-                        customdata=np.column_stack((stint_data["lap_number"],))
-                    ))
-    
-    # Update layout
-    fig.update_layout(
-        title="Tire Degradation Analysis",
-        xaxis_title="Tire Life (laps)",
-        yaxis_title="Lap Time (seconds)",
-        yaxis=dict(autorange="reversed"),  # Lower times at the top
-        hovermode="closest",
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="white"),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        height=500
-    )
+    fig = _tire_figure(session_id, selected_drivers)
     
     st.plotly_chart(fig, use_container_width=True)
     
     # Show stint summary
     st.subheader("Stint Summary")
     
-    # Calculate stint information
-    stint_summary = []
-    for driver in selected_drivers:
-        driver_data = filtered_df[filtered_df["driver_name"] == driver]
-        if not driver_data or (isinstance(driver_data, pd.DataFrame) and driver_data.empty):
-            st.warning("No driver dara available!")
-            # Group by stint
-            stints = driver_data["stint"].unique()
-            stints = [s for s in stints if pd.notna(s)]
-            
-            for stint in stints:
-                stint_data = driver_data[driver_data["stint"] == stint]
-                if len(stint_data) > 1:  # Only include stints with at least 2 laps
-                    compound = stint_data["compound"].iloc[0] if pd.notna(stint_data["compound"].iloc[0]) else "Unknown"
-                    
-                    # Calculate stint statistics
-                    stint_length = len(stint_data)
-                    min_lap_time = stint_data["lap_time_sec"].min()
-                    max_lap_time = stint_data["lap_time_sec"].max()
-                    avg_lap_time = stint_data["lap_time_sec"].mean()
-                    degradation = (max_lap_time - min_lap_time) / stint_length if stint_length > 0 else 0
-                    
-                    stint_summary.append({
-                        "Driver": driver,
-                        "Stint": int(stint),
-                        "Compound": compound,
-                        "Laps": stint_length,
-                        "Min Time": format_seconds_to_time(min_lap_time),
-                        "Avg Time": format_seconds_to_time(avg_lap_time),
-                        "Deg/Lap": f"{degradation:.3f}s"
-                    })
-    
-    if stint_summary:
-        stint_df = pd.DataFrame(stint_summary)
-        st.dataframe(stint_df, use_container_width=True, hide_index=True)
-    else:
+    stint_df = _cached_stint_summary(session_id, selected_drivers)
+    
+    if stint_df.empty:
         st.info("No valid stint data to display.")
+        return
+    
+    st.dataframe(stint_df, use_container_width=True, hide_index=True)
 
-def show_driver_comparison(laps_df):
+def show_driver_comparison(laps_df, session_id, driver_colors):
     """Show driver comparison visualization."""
     st.subheader("Driver Comparison")
     
@@ -377,46 +460,35 @@ def show_driver_comparison(laps_df):
         remaining_drivers = [d for d in drivers if d != driver1]
         driver2 = st.selectbox("Select Driver 2", remaining_drivers, index=0 if len(remaining_drivers) > 0 else 0)
     
-    # Filter data for the selected drivers
-    driver1_data = laps_df[laps_df["driver_name"] == driver1].copy()
-    driver2_data = laps_df[laps_df["driver_name"] == driver2].copy()
+    # One mask for both drivers' laps; the slices are only read, so no copies
+    pair_df = laps_df[laps_df["driver_name"].isin([driver1, driver2])]
+    driver1_data = pair_df[pair_df["driver_name"] == driver1]
+    driver2_data = pair_df[pair_df["driver_name"] == driver2]
     
-    # Filter out deleted laps
-    driver1_data = driver1_data[~(driver1_data["deleted"] == 1)]
-    driver2_data = driver2_data[~(driver2_data["deleted"] == 1)]
-    
-    if ((isinstance(driver1_data, pd.DataFrame) and not driver1_data.empty) or (not isinstance(driver1_data, pd.DataFrame) and driver1_data)) and \
-    ((isinstance(driver2_data, pd.DataFrame) and not driver2_data.empty) or (not isinstance(driver2_data, pd.DataFrame) and driver2_data)):
+    if driver1_data.empty or driver2_data.empty:
         st.warning("Insufficient data for comparison.")
-        return    
+        return
     
     # Calculate lap time differences
     st.subheader("Lap Time Comparison")
     
-    # Create a dataframe for comparison
-    common_laps = set(driver1_data["lap_number"]) & set(driver2_data["lap_number"])
-    comparison_data = []
-    
-    for lap in common_laps:
-        lap1 = driver1_data[driver1_data["lap_number"] == lap].iloc[0]
-        lap2 = driver2_data[driver2_data["lap_number"] == lap].iloc[0]
-        
-        if pd.notna(lap1["lap_time_sec"]) and pd.notna(lap2["lap_time_sec"]):
-            time_diff = lap1["lap_time_sec"] - lap2["lap_time_sec"]
-            
-            comparison_data.append({
-                "Lap": int(lap),
-                f"{driver1} Time": format_seconds_to_time(lap1["lap_time_sec"]),
-                f"{driver2} Time": format_seconds_to_time(lap2["lap_time_sec"]),
-                "Difference": f"{time_diff:.3f}s",
-                "Delta": time_diff,
-                f"{driver1} Compound": lap1["compound"],
-                f"{driver2} Compound": lap2["compound"]
-            })
-    
-    if comparison_data:
-        comparison_df = pd.DataFrame(comparison_data)
-        
+    # Pair up the laps both drivers completed with one hashed join
+    cols = ["lap_number", "lap_time_sec", "compound"]
+    merged = driver1_data[cols].merge(driver2_data[cols], on="lap_number", suffixes=("_1", "_2"))
+    merged = merged.dropna(subset=["lap_time_sec_1", "lap_time_sec_2"]).sort_values("lap_number")
+    delta = merged["lap_time_sec_1"] - merged["lap_time_sec_2"]
+    
+    comparison_df = pd.DataFrame({
+        "Lap": merged["lap_number"].astype(int),
+        f"{driver1} Time": format_seconds_series(merged["lap_time_sec_1"]),
+        f"{driver2} Time": format_seconds_series(merged["lap_time_sec_2"]),
+        "Difference": delta.map("{:.3f}s".format),
+        "Delta": delta,
+        f"{driver1} Compound": merged["compound_1"],
+        f"{driver2} Compound": merged["compound_2"]
+    })
+    
+    if not comparison_df.empty:
         # Create a visualization of the lap time delta
         fig = go.Figure()
         
@@ -424,14 +496,14 @@ def show_driver_comparison(laps_df):
         fig.add_hline(y=0, line_width=1, line_dash="dash", line_color="grey")
         
         # Add the delta trace
-        driver1_color = driver1_data["team_color"].iloc[0]
-        driver2_color = driver2_data["team_color"].iloc[0]
+        driver1_color = driver_colors[driver1]
+        driver2_color = driver_colors[driver2]
         
         fig.add_trace(go.Bar(
             x=comparison_df["Lap"],
             y=comparison_df["Delta"],
             name=f"{driver1} vs {driver2} Delta",
-            marker_color=[driver1_color if d > 0 else driver2_color for d in comparison_df["Delta"]],
+            marker_color=np.where(comparison_df["Delta"].to_numpy() > 0, driver1_color, driver2_color),
             hovertemplate=(
                 "Lap: %{x}<br>"
                 "Delta: %{y:.3f}s<br>"
@@ -440,12 +512,12 @@ def show_driver_comparison(laps_df):
                 f"{driver1} Tire: %{{customdata[2]}}<br>"
                 f"{driver2} Tire: %{{customdata[3]}}"
             ),
-            customdata=np.column_stack((
-                comparison_df[f"{driver1} Time"],
-                comparison_df[f"{driver2} Time"],
-                comparison_df[f"{driver1} Compound"],
-                comparison_df[f"{driver2} Compound"]
-            ))
+            customdata=comparison_df[[
+                f"{driver1} Time",
+                f"{driver2} Time",
+                f"{driver1} Compound",
+                f"{driver2} Compound"
+            ]].to_numpy()
         ))
         
         # Update layout
@@ -453,11 +525,8 @@ def show_driver_comparison(laps_df):
             title=f"Lap Time Delta: {driver1} vs {driver2}",
             xaxis_title="Lap Number",
             yaxis_title="Time Delta (seconds)",
-            hovermode="closest",
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="white"),
-            height=400
+            uirevision=f"{session_id}-comparison",
+            **dict(_COMMON_LAYOUT, height=400)
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -494,66 +563,40 @@ def show_driver_comparison(laps_df):
     else:
         st.info("No common laps available for comparison.")
 
-def show_lap_time_analysis(laps_df):
+def show_lap_time_analysis(session_id, selected_drivers):
     st.subheader("Lap Time Analysis")
 
-    drivers = laps_df["driver_name"].unique().tolist()
-    selected_drivers = st.multiselect("Select Drivers", drivers, default=drivers[:5])
-
-    filtered_df = laps_df[laps_df["driver_name"].isin(selected_drivers)]
-    if filtered_df.empty:
+    if not selected_drivers:
         st.warning("No data available with the current filters.")
         return
 
-    fig = go.Figure()
-
-    for driver in selected_drivers:
-        driver_data = filtered_df[filtered_df["driver_name"] == driver]
-        if not driver_data.empty:
-            fig.add_trace(go.Scatter(
-                x=driver_data["lap_number"],
-                y=driver_data["lap_time_sec"],
-                mode="lines+markers",
-                name=driver
-            ))
-
-    fig.update_layout(
-        title="Lap Times Evolution",
-        xaxis_title="Lap Number",
-        yaxis_title="Lap Time (seconds)",
-        yaxis=dict(autorange="reversed"),
-        hovermode="closest"
-    )
+    fig = _lap_time_figure(session_id, selected_drivers)
 
     st.plotly_chart(fig, use_container_width=True)
 
 def show_fastest_laps(laps_df):
     st.subheader("Fastest Laps")
 
-    drivers = laps_df["driver_name"].unique().tolist()
-    fastest_laps = []
-
-    for driver in drivers:
-        driver_data = laps_df[laps_df["driver_name"] == driver]
-        if not driver_data.empty:
-            fastest_lap = driver_data.loc[driver_data["lap_time_sec"].idxmin()]
-            fastest_laps.append({
-                "Driver": fastest_lap["driver_name"],
-                "Lap": int(fastest_lap["lap_number"]),
-                "Time": format_seconds_to_time(fastest_lap["lap_time_sec"])
-            })
-
-    if fastest_laps:
-        fastest_laps_df = pd.DataFrame(fastest_laps).sort_values("Time")
-        st.dataframe(fastest_laps_df, use_container_width=True, hide_index=True)
-    else:
+    valid = laps_df.dropna(subset=["lap_time_sec"])
+    if valid.empty:
         st.info("No valid lap times to display.")
+        return
 
-def format_seconds_to_time(seconds):
-    if pd.isna(seconds):
-        return "N/A"
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
-    return f"{minutes:02}:{remaining_seconds:06.3f}"
-
-lap_times()
\ No newline at end of file
+    # One stable sort, then each driver's first row is their fastest lap, already in order
+    fastest = valid.sort_values("lap_time_sec", kind="stable").drop_duplicates("driver_name")
+    fastest_laps_df = pd.DataFrame({
+        "Driver": fastest["driver_name"],
+        "Lap": fastest["lap_number"].astype(int),
+        "Time": format_seconds_series(fastest["lap_time_sec"])
+    })
+    st.dataframe(fastest_laps_df, use_container_width=True, hide_index=True)
+
+def format_seconds_series(seconds):
+    """Format a Series of seconds as MM:SS.fff in one pass; missing values become "N/A"."""
+    seconds = pd.to_numeric(seconds, errors="coerce")
+    minutes = (seconds // 60).fillna(0).astype(int).astype(str).str.zfill(2)
+    remainder = (seconds % 60).map("{:06.3f}".format)
+    return (minutes + ":" + remainder).where(seconds.notna(), "N/A")
+
+if __name__ == "__main__":
+    lap_times()
@@ -3,11 +3,11 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def overtakes_analysis():
     """Overtake Analysis & Race Progression."""
@@ -133,4 +133,5 @@ def plot_drs_impact(df):
     )
     st.plotly_chart(fig, use_container_width=True)
 
-overtakes_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    overtakes_analysis()
@@ -680,4 +680,5 @@ def show_pit_stop_analysis(db, year):
     This analysis requires additional data processing capabilities.
     """)
 
-performance()
\ No newline at end of file
+if __name__ == "__main__":
+    performance()
@@ -5,11 +5,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError, ResourceNotFoundError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -327,4 +327,5 @@ def show_race_overview(laps_df):
     st.info("Race overview would be displayed here.")
     # Implement with proper error handling
 
-race_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    race_analysis()
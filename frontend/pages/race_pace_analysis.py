@@ -5,11 +5,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 from numpy.polynomial.polynomial import Polynomial
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -134,4 +134,5 @@ def plot_sector_analysis(df):
     fig.update_traces(line=dict(width=3))
     st.plotly_chart(fig, use_container_width=True)
 
-race_pace_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    race_pace_analysis()
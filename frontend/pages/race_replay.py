@@ -3,11 +3,11 @@ import pandas as pd
 import plotly.express as px
 import time
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -255,4 +255,5 @@ def race_replay():
     except Exception as e:
         st.error(f"⚠️ Unexpected error: {e}")
 
-race_replay()
\ No newline at end of file
+if __name__ == "__main__":
+    race_replay()
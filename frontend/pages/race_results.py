@@ -3,11 +3,11 @@ import pandas as pd
 from datetime import datetime
 
 from frontend.components.race_visuals import show_race_results, show_position_changes, show_points_distribution, show_race_summary
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     if isinstance(data, pd.DataFrame):
@@ -92,4 +92,5 @@ def race_results():
     except Exception as e:
         st.error(f"⚠️ Unexpected error: {e}")
 
-race_results()
\ No newline at end of file
+if __name__ == "__main__":
+    race_results()
@@ -2,11 +2,11 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -115,4 +115,5 @@ def plot_reaction_time_analysis(df):
     fig.update_layout(yaxis_title="Sector 1 Time (Lower is Better)")
     st.plotly_chart(fig, use_container_width=True)
 
-race_start_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    race_start_analysis()
@@ -4,11 +4,11 @@ import plotly.express as px
 from datetime import datetime
 
 from frontend.components.event_cards import event_cards_grid
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     if isinstance(data, pd.DataFrame):
@@ -41,21 +41,29 @@ def season_overview():
         display_season_map(events_df, selected_year)
         display_season_format(events_df, selected_year)
 
-        st.subheader("Season Calendar")
-        selected_event = event_cards_grid(events_df)
-
-        if selected_event:
-            st.session_state["selected_event"] = selected_event
-
-        event_id = st.session_state.get("selected_event", None)
-        if event_id:
-            display_event_details(event_id)
+        display_season_calendar(events_df)
 
     except DatabaseError as e:
         st.error(f"⚠️ Database error: {e}")
     except Exception as e:
         st.error(f"⚠️ Unexpected error: {e}")
 
+@st.fragment
+def display_season_calendar(events_df):
+    """Event cards plus the selected event's details.
+
+    Runs as a fragment so clicking a card only reruns this section, not the map and format charts.
+    """
+    st.subheader("Season Calendar")
+    selected_event = event_cards_grid(events_df)
+
+    if selected_event:
+        st.session_state["selected_event"] = selected_event
+
+    event_id = st.session_state.get("selected_event", None)
+    if event_id:
+        display_event_details(event_id)
+
 def display_season_map(events_df, selected_year):
     st.subheader("Season Map")
 
@@ -177,4 +185,5 @@ def display_event_details(event_id):
     else:
         st.info("No sessions available for this event.")
 
-season_overview()
+if __name__ == "__main__":
+    season_overview()
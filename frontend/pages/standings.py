@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 import numpy as np
 from datetime import datetime
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -18,7 +18,7 @@ def standings():
     
     try:
         # Initialize data service
-        data_service = F1DataService()
+        data_service = get_data_service()
 
         # Get available years
         available_years = data_service.get_available_years()
@@ -272,9 +272,8 @@ def show_season_progress(data_service, year):
         
         # Get all races with sessions
         races = []
-        for _, event in events.iterrows():
-            event_id = event['id']
-            sessions = data_service.get_sessions(event_id)
+        for event in events[['id', 'round_number', 'event_name']].to_dict('records'):
+            sessions = data_service.get_sessions(event['id'])
             
             if not is_data_empty(sessions):
                 # Convert to DataFrame if needed
@@ -286,15 +285,9 @@ def show_season_progress(data_service, year):
                 else:
                     sessions_df = sessions
                     
-                # Find race sessions
-                for _, session in sessions_df.iterrows():
-                    if session['session_type'] == 'race':
-                        races.append({
-                            'id': event['id'],
-                            'round_number': event['round_number'],
-                            'event_name': event['event_name'],
-                            'session_id': session['id']
-                        })
+                # Find race sessions with a mask rather than building a Series per row
+                race_ids = sessions_df.loc[sessions_df['session_type'] == 'race', 'id'].tolist()
+                races.extend({**event, 'session_id': session_id} for session_id in race_ids)
         
         # Convert races to DataFrame
         races_df = pd.DataFrame(races) if races else pd.DataFrame()
@@ -435,4 +428,5 @@ def lighten_color(hex_color, factor=0.3):
         # If there's an error processing the color, return a default
         return "#CCCCCC"
 
-standings()
\ No newline at end of file
+if __name__ == "__main__":
+    standings()
@@ -4,11 +4,11 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -144,4 +144,5 @@ def plot_pit_stops_vs_race_time(df):
     fig.update_layout(xaxis_title="Total Pit Stops", yaxis_title="Total Race Time (s)")
     st.plotly_chart(fig, use_container_width=True)
 
-strategy_comparison_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    strategy_comparison_analysis()
@@ -6,11 +6,11 @@ import plotly.graph_objects as go
 
 from frontend.components.common_visualizations import create_line_chart
 from frontend.components.telemetry_visuals import show_track_map
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError, ResourceNotFoundError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -142,4 +142,5 @@ def telemetry():
     except Exception as e:
         st.error(f"Unexpected error: {e}")
 
-telemetry()
\ No newline at end of file
+if __name__ == "__main__":
+    telemetry()
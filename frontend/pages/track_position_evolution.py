@@ -3,11 +3,11 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -80,4 +80,5 @@ def plot_track_position_heatmap(df):
     fig.update_layout(xaxis_title="X Position", yaxis_title="Y Position")
     st.plotly_chart(fig, use_container_width=True)
 
-track_position_evolution()
\ No newline at end of file
+if __name__ == "__main__":
+    track_position_evolution()
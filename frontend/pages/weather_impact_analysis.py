@@ -2,11 +2,11 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-from backend.data_service import F1DataService
+from frontend.data_service import get_data_service
 from backend.error_handling import DatabaseError
 
 # Initialize data service
-data_service = F1DataService()
+data_service = get_data_service()
 
 def is_data_empty(data):
     """Check if data is empty, whether it's a DataFrame or list/dict."""
@@ -107,4 +107,5 @@ def plot_tire_performance_by_weather(df):
     )
     st.plotly_chart(fig, use_container_width=True)
 
-weather_impact_analysis()
\ No newline at end of file
+if __name__ == "__main__":
+    weather_impact_analysis()
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("plotly")
+
+from frontend.components.common_visualizations import downsample_by_group, m4_indices
+
+
+def _laps(drivers, laps_per_driver):
+    return pd.DataFrame({
+        "driver_name": np.repeat(drivers, laps_per_driver),
+        "lap_number": np.tile(np.arange(1, laps_per_driver + 1), len(drivers)),
+        "lap_time_sec": np.linspace(90.0, 95.0, len(drivers) * laps_per_driver)
+    })
+
+
+def test_small_groups_keep_missing_laps_when_frame_exceeds_limit():
+    # 8 drivers x 70 laps is over the limit, but each driver alone is not
+    laps_df = _laps([f"Driver {i}" for i in range(8)], 70)
+    laps_df.loc[[5, 80], "lap_time_sec"] = np.nan
+
+    result = downsample_by_group(laps_df, "driver_name", "lap_number", "lap_time_sec", 500)
+
+    assert len(result) == len(laps_df)
+    assert result["lap_time_sec"].isna().sum() == 2
+
+
+def test_large_group_keeps_missing_laps_as_gaps():
+    laps_df = _laps(["Driver A"], 1000)
+    laps_df.loc[10, "lap_time_sec"] = np.nan
+
+    result = downsample_by_group(laps_df, "driver_name", "lap_number", "lap_time_sec", 100)
+
+    assert result["lap_time_sec"].notna().sum() == 100
+    assert result["lap_time_sec"].isna().sum() == 1
+    assert result.index.is_monotonic_increasing
+
+
+def test_rows_with_missing_group_key_are_kept():
+    laps_df = _laps(["Driver A"], 1000)
+    laps_df["stint"] = 1.0
+    laps_df.loc[:2, "stint"] = np.nan
+
+    result = downsample_by_group(laps_df, "stint", "lap_number", "lap_time_sec", 100)
+
+    assert result["stint"].isna().sum() == 3
+
+
+def test_m4_skips_missing_x_instead_of_failing():
+    # A whole bucket of missing tyre_life values used to make idxmin raise
+    x = np.arange(1000, dtype="float64")
+    x[100:400] = np.nan
+    y = np.random.default_rng(0).random(1000)
+
+    picked = m4_indices(x, y, 100)
+
+    assert len(picked) <= 100
+    assert not np.isnan(x[picked]).any()
+    assert (np.diff(picked) > 0).all()
+
+
+def test_m4_tire_frame_keeps_laps_without_stint():
+    laps_df = _laps(["Driver A"], 1000).rename(columns={"lap_number": "tyre_life"})
+    laps_df["stint"] = 1.0
+    laps_df.loc[997:, "stint"] = np.nan
+
+    result = downsample_by_group(
+        laps_df, ["driver_name", "stint"], "tyre_life", "lap_time_sec", 100, method="m4"
+    )
+
+    assert result["stint"].isna().sum() == 3
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("plotly")
+
+from frontend.pages.lap_times import DEFAULT_DRIVER_COLOR, driver_color_map
+
+
+def test_driver_color_map_uses_team_colour():
+    laps_df = pd.DataFrame({
+        "driver_name": ["Max Verstappen", "Max Verstappen"],
+        "team_color": ["#3671C6", "#3671C6"]
+    }).astype("category")
+
+    assert driver_color_map(laps_df) == {"Max Verstappen": "#3671C6"}
+
+
+def test_driver_color_map_defaults_driver_without_team():
+    # LEFT JOIN teams yields a NULL colour for drivers with no team row
+    laps_df = pd.DataFrame({
+        "driver_name": ["Max Verstappen", "Reserve Driver"],
+        "team_color": ["#3671C6", None]
+    }).astype("category")
+
+    colors = driver_color_map(laps_df)
+
+    assert colors["Reserve Driver"] == DEFAULT_DRIVER_COLOR
+    assert all(isinstance(color, str) for color in colors.values())